@@ -0,0 +1,240 @@
+import argparse
+import json
+import logging
+import os
+import re
+import sys
+import time
+from multiprocessing import Pool
+from typing import Any, Dict, Iterator, List, Optional, Set
+from bootstrap import initialize
+from logger import worker_log_queue
+from telemetry import telemetry
+
+logger = logging.getLogger(__name__)
+
+_worker_pipeline = None
+_in_worker = False
+
+
+def load_submissions(path: str) -> Iterator[Dict[str, Any]]:
+    seen: Set[str] = set()
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+                if not isinstance(record, dict):
+                    raise ValueError("expected a JSON object")
+            except ValueError as e:
+                # One bad line should not abort the whole run; it is reported as a failed submission
+                yield {
+                    "request_id": _unique_id(f"line-{line_number}", line_number, seen),
+                    "input_text": None,
+                    "file_path": None,
+                    "error": f"Malformed submission on line {line_number}: {str(e)}"
+                }
+                continue
+            request_id = str(record.get("request_id") or record.get("id") or f"line-{line_number}")
+            yield {
+                "request_id": _unique_id(request_id, line_number, seen),
+                "input_text": _input_text(record),
+                "file_path": record.get("file_path") or record.get("file")
+            }
+
+
+def load_checkpoint(path: str) -> Set[str]:
+    # Completed ids from a previous run; failed or half-written records are retried
+    completed = set()
+    if not os.path.exists(path):
+        return completed
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if record.get("status") == "ok":
+                completed.add(record["request_id"])
+    return completed
+
+
+def compact_output(path: str) -> int:
+    # A retried submission is appended after its earlier error record; keep only the last record
+    # per request_id (and drop half-written lines) so the file has one line per submission
+    records: Dict[str, str] = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            records.pop(record["request_id"], None)
+            records[record["request_id"]] = line if line.endswith("\n") else line + "\n"
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.writelines(records.values())
+    os.replace(tmp_path, path)
+    return len(records)
+
+
+def process_submission(submission: Dict[str, Any]) -> Dict[str, Any]:
+    started = time.perf_counter()
+    if submission.get("error"):
+        logger.error(submission["error"])
+        # Never reached the pipeline, so it carries no latency
+        return {"request_id": submission["request_id"], "status": "error", "error": submission["error"]}
+    try:
+        result = _get_pipeline().run(submission["input_text"], submission["file_path"], request_id=submission["request_id"])
+        record = {"request_id": submission["request_id"], "status": "ok", "result": result}
+    except Exception as e:
+        logger.error(f"Submission {submission['request_id']} failed: {str(e)}")
+        record = {"request_id": submission["request_id"], "status": "error", "error": str(e)}
+    record["latency_ms"] = round((time.perf_counter() - started) * 1000, 3)
+    if _in_worker:
+        # Hand the spans back so the parent's metrics and traces cover every worker
+        record["spans"] = telemetry.trace(submission["request_id"])
+    return record
+
+
+def run_batch(input_path: str, output_path: str, workers: int = 1, resume: bool = True,
+              trace_dir: Optional[str] = None, metrics_path: Optional[str] = None) -> Dict[str, Any]:
+    completed = load_checkpoint(output_path) if resume else set()
+    pending = [s for s in load_submissions(input_path) if s["request_id"] not in completed]
+    logger.info(f"Batch run: {len(pending)} pending, {len(completed)} already completed")
+
+    _terminate_partial_line(output_path, resume)
+    if trace_dir:
+        os.makedirs(trace_dir, exist_ok=True)
+    latencies: List[float] = []
+    processed = failed = 0
+    started = time.perf_counter()
+    with open(output_path, "a" if resume else "w", encoding="utf-8") as out:
+        for record in _map_submissions(pending, workers):
+            telemetry.ingest(record.pop("spans", []))
+            out.write(json.dumps(record) + "\n")
+            out.flush()
+            if trace_dir:
+                _write_trace(trace_dir, record["request_id"])
+            processed += 1
+            if "latency_ms" in record:
+                latencies.append(record["latency_ms"])
+            if record["status"] != "ok":
+                failed += 1
+    wall_seconds = time.perf_counter() - started
+    compact_output(output_path)
+
+    summary = {
+        "processed": processed,
+        "succeeded": processed - failed,
+        "failed": failed,
+        "skipped": len(completed),
+        "workers": workers,
+        "wall_seconds": round(wall_seconds, 3),
+        "throughput_per_second": round(processed / wall_seconds, 3) if wall_seconds > 0 else 0.0,
+        "latency_ms": _latency_summary(latencies)
+    }
+    if metrics_path:
+        with open(metrics_path, "w", encoding="utf-8") as f:
+            f.write(telemetry.render_openmetrics())
+    logger.info(f"Batch run finished: {json.dumps(summary)}")
+    return summary
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run JSONL insurance submissions through the agent pipeline without the UI.")
+    parser.add_argument("input", help="JSONL file with one submission per line")
+    parser.add_argument("-o", "--output", required=True, help="JSONL file that results are streamed to")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1, help="number of worker processes")
+    parser.add_argument("--no-resume", action="store_true", help="ignore and overwrite an existing output file")
+    parser.add_argument("--trace-dir", help="directory to write one trace JSON file per request")
+    parser.add_argument("--metrics", help="file to write OpenMetrics latency histograms and counters to")
+    args = parser.parse_args(argv)
+    initialize()
+
+    summary = run_batch(args.input, args.output, workers=max(1, args.workers), resume=not args.no_resume,
+                        trace_dir=args.trace_dir, metrics_path=args.metrics)
+    print(json.dumps(summary, indent=2))
+    return 1 if summary["failed"] else 0
+
+
+def _input_text(record: Dict[str, Any]) -> str:
+    if record.get("input_text"):
+        return record["input_text"]
+    # Backlog-style records carry a title and body instead of a single query
+    return "\n\n".join(part for part in (record.get("title"), record.get("body")) if part)
+
+
+def _unique_id(request_id: str, line_number: int, seen: Set[str]) -> str:
+    # A repeated id gets its line number appended; otherwise both submissions would collapse into
+    # one output record and one checkpoint entry
+    if request_id in seen:
+        logger.warning(f"Duplicate request_id {request_id} on line {line_number}")
+        request_id = f"{request_id}#line-{line_number}"
+    seen.add(request_id)
+    return request_id
+
+
+def _get_pipeline():
+    global _worker_pipeline
+    if _worker_pipeline is None:
+        from main import build_pipeline
+        _worker_pipeline = build_pipeline()
+    return _worker_pipeline
+
+
+def _map_submissions(submissions: List[Dict[str, Any]], workers: int) -> Iterator[Dict[str, Any]]:
+    if workers == 1 or len(submissions) <= 1:
+        for submission in submissions:
+            yield process_submission(submission)
+        return
+    # Workers log through the parent's writer rather than opening the log files themselves
+    initialize()
+    with Pool(processes=workers, initializer=_init_worker, initargs=(worker_log_queue(),)) as pool:
+        for record in pool.imap_unordered(process_submission, submissions):
+            yield record
+
+
+def _init_worker(log_queue) -> None:
+    global _in_worker
+    _in_worker = True
+    initialize(log_queue=log_queue)
+
+
+def _write_trace(trace_dir: str, request_id: str) -> None:
+    file_name = re.sub(r"[^\w.-]", "_", request_id) + ".json"
+    with open(os.path.join(trace_dir, file_name), "w", encoding="utf-8") as f:
+        f.write(telemetry.trace_json(request_id))
+
+
+def _terminate_partial_line(path: str, resume: bool) -> None:
+    # A run killed mid-write leaves an unterminated line; start the next record on a fresh one
+    if not resume or not os.path.exists(path) or os.path.getsize(path) == 0:
+        return
+    with open(path, "rb+") as f:
+        f.seek(-1, os.SEEK_END)
+        if f.read(1) != b"\n":
+            f.write(b"\n")
+
+
+def _latency_summary(latencies: List[float]) -> Dict[str, float]:
+    if not latencies:
+        return {}
+    ordered = sorted(latencies)
+
+    def percentile(p: float) -> float:
+        return ordered[min(len(ordered) - 1, int(round(p * (len(ordered) - 1))))]
+
+    return {
+        "mean": round(sum(ordered) / len(ordered), 3),
+        "p50": percentile(0.50),
+        "p95": percentile(0.95),
+        "p99": percentile(0.99),
+        "max": ordered[-1]
+    }
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
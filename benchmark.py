@@ -0,0 +1,387 @@
+import argparse
+import gc
+import importlib
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import types
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import synthetic_data
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json")
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_REPEATS = 5
+SEED = 1234
+
+# name -> setup(); setup returns (run, operations per run) or raises BenchmarkUnavailable when the
+# module under test cannot be imported in this environment
+BENCHMARKS: Dict[str, Callable[[], Tuple[Callable[[], Any], int]]] = {}
+
+
+# Modules the agents import for the LLM base class and the HTTP tools. The benchmarks never call
+# Agent.__init__ and hand the agents stub tools, so an empty stand-in is installed for any that
+# cannot be imported
+STAND_IN_MODULES = {
+    "crewai": ["Agent", "Crew", "Task"],
+    "tools": [],
+    "tools.google_search": ["GoogleSearchTool"],
+    "tools.weather_api": ["WeatherAPITool"],
+    "tools.climatiq_api": ["ClimatiqAPITool"],
+    "tools.risk_assessment": ["RiskAssessmentTool"]
+}
+
+
+class BenchmarkUnavailable(Exception):
+    pass
+
+
+def benchmark(name: str):
+    def decorator(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return decorator
+
+
+def install_stand_ins() -> None:
+    for module_name, class_names in STAND_IN_MODULES.items():
+        try:
+            importlib.import_module(module_name)
+            continue
+        except ImportError:
+            pass
+        module = types.ModuleType(module_name)
+        for class_name in class_names:
+            setattr(module, class_name, type(class_name, (), {}))
+        sys.modules[module_name] = module
+
+
+def require(module_name: str):
+    # Only a failed import of the module under test makes a benchmark unavailable; an ImportError
+    # raised while the benchmark runs is a real failure
+    install_stand_ins()
+    try:
+        return importlib.import_module(module_name)
+    except ImportError as e:
+        raise BenchmarkUnavailable(f"cannot import {module_name}: {str(e)}") from e
+
+
+def bare_agent(cls, **attributes):
+    # Skips Agent.__init__ so no LLM is configured; the scoring methods only need a logger and tools
+    agent = cls.__new__(cls)
+    object.__setattr__(agent, "logger", logging.getLogger(cls.__module__))
+    for key, value in attributes.items():
+        object.__setattr__(agent, key, value)
+    return agent
+
+
+class StubWeatherTool:
+    def __init__(self, seed: int):
+        self.weather = [synthetic_data.generate_weather(seed + i) for i in range(64)]
+        self.calls = 0
+
+    def get_weather(self, location):
+        self.calls += 1
+        return self.weather[self.calls % len(self.weather)]
+
+
+class StubClimatiqTool:
+    def estimate_emissions(self, industry, company_size):
+        return {"co2e": company_size * 0.0004}
+
+
+class StubSearchTool:
+    def __init__(self, results):
+        self.results = results
+        self.calls = 0
+
+    def search(self, query):
+        self.calls += 1
+        return self.results[self.calls % len(self.results)]
+
+
+class StubTaskOutput:
+    def __init__(self, description):
+        self.description = description
+        self.agent = "stub"
+
+
+class StubCrew:
+    # Stands in for crew.kickoff with the LLM removed: walks the task list and returns canned output
+    tasks = ["analyze input", "evaluate risks", "draft policy", "outline exposure", "assess esg", "summarize"]
+
+    def __init__(self, agents=()):
+        self.agents = list(agents)
+
+    def kickoff(self, input_text, file_content):
+        from telemetry import telemetry
+        for description in self.tasks:
+            telemetry.task_callback(StubTaskOutput(description))
+        return f"Insurance Analysis Summary for: {input_text[:40]}"
+
+
+@benchmark("risk_exposure.portfolio")
+def _risk_exposure_portfolio():
+    agent = bare_agent(require("risk_exposure").RiskExposure)
+    portfolio = synthetic_data.generate_portfolio(5000, SEED)
+
+    def run():
+        exposure = agent.calculate_portfolio_exposure(portfolio)
+        for policy in portfolio:
+            agent.generate_risk_report(exposure, agent.analyze_risk_factors(policy))
+    return run, len(portfolio)
+
+
+@benchmark("underwriting.fraud_screening")
+def _underwriting_fraud_screening():
+    agent = bare_agent(require("underwriting").Underwriting)
+    applicants = synthetic_data.generate_applicants(20000, SEED)
+
+    def run():
+        for applicant in applicants:
+            agent.recommend_policy("Medium risk", agent.detect_fraud(applicant))
+    return run, len(applicants)
+
+
+@benchmark("policy_management.claims")
+def _policy_management_claims():
+    agent = bare_agent(require("policy_managment").PolicyManagement)
+    claims = synthetic_data.generate_claims(20000, SEED)
+
+    def run():
+        for claim in claims:
+            agent.manage_claim(claim)
+    return run, len(claims)
+
+
+@benchmark("esg_compliance.scoring")
+def _esg_compliance_scoring():
+    ESGCompliance = require("esg_compliance").ESGCompliance
+    results = synthetic_data.generate_esg_search_results(200, 10, SEED)
+    agent = bare_agent(ESGCompliance, hazard_grid=None,
+                       tools=[StubSearchTool(results), StubWeatherTool(SEED), StubClimatiqTool()])
+    companies = synthetic_data.generate_companies(2000, SEED)
+
+    def run():
+        for company in companies:
+            compliance = agent.assess_esg_compliance(company)
+            carbon_risk = agent.calculate_carbon_risk(company)
+            agent.generate_esg_report(compliance, carbon_risk)
+    return run, len(companies)
+
+
+def hazard_grid_file(rows: int = 720, cols: int = 1440) -> str:
+    # Global quarter-degree grid, written once per process
+    from hazard_grid import write_hazard_grid
+    path = os.path.join(tempfile.gettempdir(), f"benchmark_hazard_{rows}x{cols}_{SEED}.grid")
+    if not os.path.exists(path):
+        write_hazard_grid(path, -90.0, -180.0, 180.0 / rows, synthetic_data.generate_hazard_bands(rows, cols, SEED))
+    return path
+
+
+@benchmark("hazard_grid.lookup")
+def _hazard_grid_lookup():
+    from hazard_grid import HazardGrid
+    grid = HazardGrid(hazard_grid_file())
+    companies = synthetic_data.generate_companies(100000, SEED)
+    lats = [company["lat"] for company in companies]
+    lons = [company["lon"] for company in companies]
+
+    def run():
+        grid.vulnerability(lats, lons)
+    return run, len(companies)
+
+
+@benchmark("esg_compliance.portfolio_carbon_risk")
+def _esg_compliance_portfolio_carbon_risk():
+    ESGCompliance = require("esg_compliance").ESGCompliance
+    from hazard_grid import HazardGrid
+    agent = bare_agent(ESGCompliance, hazard_grid=HazardGrid(hazard_grid_file()),
+                       tools=[None, StubWeatherTool(SEED), StubClimatiqTool()])
+    companies = synthetic_data.generate_companies(20000, SEED)
+    for company in companies:
+        company["co2e"] = company["size"] * 0.0004
+
+    def run():
+        agent.calculate_portfolio_carbon_risk(companies)
+    return run, len(companies)
+
+
+def payload_files(name: str, records: List[Dict[str, Any]]) -> List[str]:
+    # One JSON upload per record, written once per process
+    directory = os.path.join(tempfile.gettempdir(), f"benchmark_{name}_{SEED}")
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for i, record in enumerate(records):
+        path = os.path.join(directory, f"{i:05d}.json")
+        if not os.path.exists(path):
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(record, f)
+        paths.append(path)
+    return paths
+
+
+@benchmark("pipeline.end_to_end")
+def _pipeline_end_to_end():
+    policy_management = bare_agent(require("policy_managment").PolicyManagement)
+    risk_exposure = bare_agent(require("risk_exposure").RiskExposure)
+    underwriting = bare_agent(require("underwriting").Underwriting)
+    from pipeline import AnalysisPipeline
+    from result_cache import ResultCache
+    from router import RequestRouter
+    crew = StubCrew([policy_management, risk_exposure, underwriting])
+    applicants = synthetic_data.generate_applicants(100, SEED)
+    applicant_files = payload_files("applicants", applicants)
+    policy_files = payload_files("portfolio", synthetic_data.generate_portfolio(100, SEED))
+
+    # Support questions and structured risk/fraud checks are answered by the agents' rule methods;
+    # open-ended quotes, with or without an upload, escalate to the stubbed crew
+    requests = []
+    for applicant, applicant_file, policy_file in zip(applicants, applicant_files, policy_files):
+        applicant_id = applicant["applicant_id"]
+        requests += [
+            (f"Where can I find my policy details for {applicant_id}?", None),
+            (f"How do I file a claim? Reference {applicant_id}", None),
+            ("Assess the risk factors for this policy", policy_file),
+            ("Run a fraud check on this applicant", applicant_file),
+            (f"Quote commercial cover for applicant {applicant_id} aged {applicant['age']}", None),
+            ("Quote commercial cover for this applicant", applicant_file)
+        ]
+
+    def run():
+        # Wired as main.build_pipeline does, with a fresh cache per run so every request is
+        # computed once and hits on the repeat
+        pipeline = AnalysisPipeline(crew, cache=ResultCache(max_entries=len(requests)), router=RequestRouter.from_crew(crew))
+        for input_text, file_path in requests + requests:
+            pipeline.run(input_text, file_path)
+    return run, len(requests) * 2
+
+
+def measure(setup: Callable[[], Tuple[Callable[[], Any], int]], repeats: int = DEFAULT_REPEATS) -> Dict[str, float]:
+    run, operations = setup()
+    run()  # warm-up
+    timings = []
+    for _ in range(repeats):
+        gc.collect()
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    median = statistics.median(timings)
+    return {
+        "operations": operations,
+        "median_seconds": round(median, 6),
+        "throughput_per_second": round(operations / median, 2),
+        "peak_memory_kib": round(peak / 1024, 1)
+    }
+
+
+def run_benchmarks(names: Optional[List[str]] = None, repeats: int = DEFAULT_REPEATS) -> Dict[str, Any]:
+    results, unavailable = {}, {}
+    for name, setup in BENCHMARKS.items():
+        if names and name not in names:
+            continue
+        try:
+            results[name] = measure(setup, repeats)
+        except BenchmarkUnavailable as e:
+            unavailable[name] = str(e)
+    return {"results": results, "unavailable": unavailable}
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            threshold: float = DEFAULT_THRESHOLD) -> List[str]:
+    regressions = []
+    for name, current in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        min_throughput = reference["throughput_per_second"] * (1 - threshold)
+        if current["throughput_per_second"] < min_throughput:
+            regressions.append(
+                f"{name}: throughput {current['throughput_per_second']:.2f}/s is below "
+                f"{min_throughput:.2f}/s (baseline {reference['throughput_per_second']:.2f}/s)"
+            )
+        max_memory = reference["peak_memory_kib"] * (1 + threshold)
+        if current["peak_memory_kib"] > max_memory:
+            regressions.append(
+                f"{name}: peak memory {current['peak_memory_kib']:.1f} KiB is above "
+                f"{max_memory:.1f} KiB (baseline {reference['peak_memory_kib']:.1f} KiB)"
+            )
+    return regressions
+
+
+def unmeasured(report: Dict[str, Any], baseline: Dict[str, Dict[str, float]],
+               names: Optional[List[str]] = None) -> List[str]:
+    # Benchmarks the gate cannot vouch for: unavailable here, or in the baseline without a result
+    expected = set(report["unavailable"]) | {name for name in baseline if not names or name in names}
+    return sorted(name for name in expected if name not in report["results"])
+
+
+def load_baseline(path: str = BASELINE_PATH) -> Dict[str, Dict[str, float]]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)["results"]
+
+
+def save_baseline(results: Dict[str, Dict[str, float]], path: str = BASELINE_PATH) -> None:
+    # Merge so a partial run (or one with unavailable benchmarks) keeps the other entries
+    merged = load_baseline(path)
+    merged.update(results)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": dict(sorted(merged.items()))
+        }, f, indent=2)
+        f.write("\n")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run scoring and pipeline benchmarks and gate on regressions.")
+    parser.add_argument("--only", action="append", choices=sorted(BENCHMARKS), help="run only this benchmark (repeatable)")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed fractional throughput drop / memory growth against the baseline")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--allow-missing", action="store_true",
+                        help="pass even if some benchmarks could not be measured in this environment")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.only, args.repeats)
+    for name, result in report["results"].items():
+        print(f"{name:40} {result['throughput_per_second']:>14,.2f} ops/s {result['peak_memory_kib']:>12,.1f} KiB peak")
+    for name, reason in report["unavailable"].items():
+        print(f"{name:40} unavailable ({reason})")
+
+    if args.update_baseline:
+        save_baseline(report["results"], args.baseline)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    regressions = compare(report["results"], baseline, args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    missing = unmeasured(report, baseline, args.only)
+    for name in missing:
+        print(f"NOT MEASURED {name}")
+    return 1 if regressions or (missing and not args.allow_missing) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
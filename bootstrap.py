@@ -0,0 +1,22 @@
+import logging
+import os
+from logger import DEBUG_SAMPLE_RATE, LOG_DIR, configure_logging, configure_worker_logging
+
+_initialized_pid = None
+
+def initialize(load_env=True, log_dir=None, log_queue=None):
+    # Explicit process start-up: nothing here runs as a side effect of importing the app modules.
+    # Tracked per process; pool workers pass the parent's log_queue instead of opening the log files.
+    global _initialized_pid
+    if _initialized_pid == os.getpid():
+        return
+    if load_env:
+        from dotenv import load_dotenv
+        load_dotenv()
+    level = getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper(), logging.INFO)
+    debug_sample_rate = float(os.getenv("LOG_DEBUG_SAMPLE_RATE", DEBUG_SAMPLE_RATE))
+    if log_queue is not None:
+        configure_worker_logging(log_queue, level=level, debug_sample_rate=debug_sample_rate)
+    else:
+        configure_logging(log_dir or os.getenv("LOG_DIR", LOG_DIR), level=level, debug_sample_rate=debug_sample_rate)
+    _initialized_pid = os.getpid()
\ No newline at end of file
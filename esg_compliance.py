@@ -1,9 +1,12 @@
 import logging
+import numpy as np
 from crewai import Agent
+from hazard_grid import climate_vulnerability, load_hazard_grid
+from telemetry import traced
 from tools.google_search import GoogleSearchTool
 from tools.weather_api import WeatherAPITool
 from tools.climatiq_api import ClimatiqAPITool
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 class ESGCompliance(Agent):
     def __init__(self):
@@ -14,7 +17,9 @@ class ESGCompliance(Agent):
             tools=[GoogleSearchTool(), WeatherAPITool(), ClimatiqAPITool()]
         )
         self.logger = logging.getLogger(__name__)
+        self.hazard_grid = load_hazard_grid()
 
+    @traced(kind="agent")
     def assess_esg_compliance(self, company_data: Dict[str, Any]) -> Dict[str, Any]:
         self.logger.info("Assessing ESG compliance")
         try:
@@ -42,25 +47,29 @@ class ESGCompliance(Agent):
             self.logger.error(f"Error during ESG compliance assessment: {str(e)}")
             raise
 
+    @traced(kind="agent")
     def calculate_carbon_risk(self, company_data: Dict[str, Any]) -> Dict[str, Any]:
         self.logger.info("Calculating carbon risk")
         try:
-            # Use Weather API to get climate data for the company's location
-            weather_data = self.tools[1].get_weather(company_data['location'])
+            # Use the precomputed hazard grid for the company's coordinates, falling back to
+            # the Weather API when the company has no coordinates or lies outside the grid
+            vulnerability = self._grid_vulnerability(company_data)
+            if vulnerability is None:
+                weather_data = self.tools[1].get_weather(company_data['location'])
+                vulnerability = self._assess_climate_vulnerability(weather_data)
             
             # Use Climatiq API to estimate CO2 emissions
-            emissions_data = self.tools[2].estimate_emissions(company_data['industry'], company_data['size'])
+            emissions_data = self._estimate_emissions(company_data)
             
             # Implement carbon risk calculation logic here
             carbon_intensity = emissions_data['co2e'] / company_data['revenue']
-            climate_vulnerability = self._assess_climate_vulnerability(weather_data)
             
-            carbon_risk_score = (carbon_intensity * 0.7) + (climate_vulnerability * 0.3)
+            carbon_risk_score = self._carbon_risk_score(carbon_intensity, vulnerability)
             
             risk_result = {
                 "carbon_risk_score": carbon_risk_score,
                 "carbon_intensity": carbon_intensity,
-                "climate_vulnerability": climate_vulnerability,
+                "climate_vulnerability": vulnerability,
                 "assessment": self._get_carbon_risk_assessment(carbon_risk_score)
             }
             
@@ -70,6 +79,42 @@ class ESGCompliance(Agent):
             self.logger.error(f"Error during carbon risk calculation: {str(e)}")
             raise
 
+    @traced(kind="agent")
+    def calculate_portfolio_carbon_risk(self, companies: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        self.logger.info(f"Calculating carbon risk for a portfolio of {len(companies)} companies")
+        try:
+            # One vectorized grid lookup for every company with coordinates
+            vulnerability = np.full(len(companies), np.nan)
+            located = [i for i, company in enumerate(companies) if 'lat' in company and 'lon' in company]
+            if self.hazard_grid is not None and located:
+                vulnerability[located] = self.hazard_grid.vulnerability(
+                    [companies[i]['lat'] for i in located], [companies[i]['lon'] for i in located]
+                )
+            for i in np.flatnonzero(np.isnan(vulnerability)):
+                weather_data = self.tools[1].get_weather(companies[i]['location'])
+                vulnerability[i] = self._assess_climate_vulnerability(weather_data)
+
+            co2e = np.array([self._estimate_emissions(company)['co2e'] for company in companies], dtype=np.float64)
+            revenue = np.array([company['revenue'] for company in companies], dtype=np.float64)
+            carbon_intensity = co2e / revenue
+            carbon_risk_scores = self._carbon_risk_score(carbon_intensity, vulnerability)
+
+            portfolio_result = [
+                {
+                    "carbon_risk_score": float(carbon_risk_scores[i]),
+                    "carbon_intensity": float(carbon_intensity[i]),
+                    "climate_vulnerability": float(vulnerability[i]),
+                    "assessment": self._get_carbon_risk_assessment(carbon_risk_scores[i])
+                }
+                for i in range(len(companies))
+            ]
+            self.logger.info("Portfolio carbon risk calculation completed successfully")
+            return portfolio_result
+        except Exception as e:
+            self.logger.error(f"Error during portfolio carbon risk calculation: {str(e)}")
+            raise
+
+    @traced(kind="agent")
     def generate_esg_report(self, esg_compliance: Dict[str, Any], carbon_risk: Dict[str, Any]) -> str:
         self.logger.info("Generating ESG report")
         try:
@@ -148,20 +193,28 @@ class ESGCompliance(Agent):
             return "Poor ESG performance, immediate action required"
 
     def _assess_climate_vulnerability(self, weather_data: Dict[str, Any]) -> float:
-        # Implement climate vulnerability assessment logic
+        # High temperature, humidity and wind speed each increase vulnerability; the thresholds
+        # are shared with the hazard grid so live and precomputed scores agree
         temperature = weather_data['main']['temp']
         humidity = weather_data['main']['humidity']
         wind_speed = weather_data['wind']['speed']
         
-        vulnerability_score = 0.0
-        if temperature > 30:  # High temperature increases vulnerability
-            vulnerability_score += 2.0
-        if humidity > 70:  # High humidity increases vulnerability
-            vulnerability_score += 1.5
-        if wind_speed > 10:  # High wind speed increases vulnerability
-            vulnerability_score += 1.5
-        
-        return min(vulnerability_score, 5.0)
+        return float(climate_vulnerability(temperature, humidity, wind_speed))
+
+    def _grid_vulnerability(self, company_data: Dict[str, Any]) -> Optional[float]:
+        if self.hazard_grid is None or 'lat' not in company_data or 'lon' not in company_data:
+            return None
+        score = float(self.hazard_grid.vulnerability([company_data['lat']], [company_data['lon']])[0])
+        return None if np.isnan(score) else score
+
+    def _estimate_emissions(self, company_data: Dict[str, Any]) -> Dict[str, Any]:
+        # Portfolio files may carry precomputed emissions, which avoids the Climatiq call
+        if 'co2e' in company_data:
+            return {"co2e": company_data['co2e']}
+        return self.tools[2].estimate_emissions(company_data['industry'], company_data['size'])
+
+    def _carbon_risk_score(self, carbon_intensity, vulnerability):
+        return (carbon_intensity * 0.7) + (vulnerability * 0.3)
 
     def _get_carbon_risk_assessment(self, score: float) -> str:
         if score < 2.0:
@@ -1,28 +1,10 @@
 import gradio as gr
-import pandas as pd
-import PyPDF2
-import io
-from crewai import Crew
+from pipeline import AnalysisPipeline
 
-def create_interface(crew: Crew):
+def create_interface(pipeline: AnalysisPipeline):
     def process_input(input_text: str, file) -> str:
-        file_content = ""
-        if file:
-            if file.name.endswith('.csv'):
-                df = pd.read_csv(file.name)
-                file_content = df.to_string()
-            elif file.name.endswith('.xlsx'):
-                df = pd.read_excel(file.name)
-                file_content = df.to_string()
-            elif file.name.endswith('.pdf'):
-                pdf_reader = PyPDF2.PdfReader(io.BytesIO(file.read()))
-                file_content = "\n".join([page.extract_text() for page in pdf_reader.pages])
-            else:
-                file_content = file.read().decode('utf-8')
-
         # Process the input and file using the crew
-        result = crew.kickoff(input_text=input_text, file_content=file_content)
-        return result
+        return pipeline.run(input_text, file.name if file else None)
 
     interface = gr.Interface(
         fn=process_input,
@@ -0,0 +1,134 @@
+import argparse
+import csv
+import os
+import struct
+import sys
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+
+MAGIC = b"INSHZD01"
+# magic, lat_min, lon_min, resolution, rows, cols, band count; data starts at HEADER_SIZE
+HEADER_FORMAT = "<8sdddIII"
+HEADER_SIZE = 64
+BANDS = ("heat", "humidity", "wind", "flood")
+
+# Long-run indices per cell: mean daily maximum temperature (C), mean relative humidity (%),
+# 95th percentile wind speed (m/s) and flood hazard index (0-1). The first three thresholds are
+# the ones ESGCompliance applies to live weather readings.
+HEAT_THRESHOLD, HEAT_SCORE = 30.0, 2.0
+HUMIDITY_THRESHOLD, HUMIDITY_SCORE = 70.0, 1.5
+WIND_THRESHOLD, WIND_SCORE = 10.0, 1.5
+FLOOD_THRESHOLD, FLOOD_SCORE = 0.5, 1.5
+MAX_VULNERABILITY = 5.0
+
+_grid_cache: Dict[str, "HazardGrid"] = {}
+
+
+def climate_vulnerability(heat, humidity, wind, flood=0.0):
+    # Vectorized over numpy arrays; NaN inputs (cells with no data) give a NaN score
+    heat, humidity, wind, flood = (np.asarray(v, dtype=np.float64) for v in (heat, humidity, wind, flood))
+    score = (
+        np.where(heat > HEAT_THRESHOLD, HEAT_SCORE, 0.0)
+        + np.where(humidity > HUMIDITY_THRESHOLD, HUMIDITY_SCORE, 0.0)
+        + np.where(wind > WIND_THRESHOLD, WIND_SCORE, 0.0)
+        + np.where(flood > FLOOD_THRESHOLD, FLOOD_SCORE, 0.0)
+    )
+    missing = np.isnan(heat) | np.isnan(humidity) | np.isnan(wind) | np.isnan(flood)
+    return np.where(missing, np.nan, np.minimum(score, MAX_VULNERABILITY))
+
+
+class HazardGrid:
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            magic, lat_min, lon_min, resolution, rows, cols, bands = struct.unpack(
+                HEADER_FORMAT, f.read(struct.calcsize(HEADER_FORMAT))
+            )
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a hazard grid file")
+        if bands != len(BANDS):
+            raise ValueError(f"{path} has {bands} bands, expected {len(BANDS)}")
+        self.path = path
+        self.lat_min = lat_min
+        self.lon_min = lon_min
+        self.resolution = resolution
+        self.rows = rows
+        self.cols = cols
+        # Pages are only read for the cells that are looked up, so memory stays flat as the grid grows
+        self.data = np.memmap(path, dtype="<f4", mode="r", offset=HEADER_SIZE, shape=(bands, rows, cols))
+
+    def lookup(self, lats: Sequence[float], lons: Sequence[float]) -> Dict[str, np.ndarray]:
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+        # Missing coordinates (NaN, or None before the float cast) stay NaN; only cells inside the
+        # grid are cast to indices, so the cast never sees NaN or out-of-range values
+        finite = np.isfinite(lats) & np.isfinite(lons)
+        rows = np.floor((lats - self.lat_min) / self.resolution)
+        cols = np.floor((lons - self.lon_min) / self.resolution)
+        inside = finite & (rows >= 0) & (rows < self.rows) & (cols >= 0) & (cols < self.cols)
+
+        values = np.full((len(BANDS), lats.size), np.nan, dtype=np.float64)
+        values[:, inside] = self.data[:, rows[inside].astype(np.int64), cols[inside].astype(np.int64)]
+        return dict(zip(BANDS, values))
+
+    def vulnerability(self, lats: Sequence[float], lons: Sequence[float]) -> np.ndarray:
+        hazards = self.lookup(lats, lons)
+        return climate_vulnerability(hazards["heat"], hazards["humidity"], hazards["wind"], hazards["flood"])
+
+
+def write_hazard_grid(path: str, lat_min: float, lon_min: float, resolution: float,
+                      bands: Dict[str, np.ndarray]) -> None:
+    stacked = np.stack([np.asarray(bands[name], dtype="<f4") for name in BANDS])
+    _, rows, cols = stacked.shape
+    header = struct.pack(HEADER_FORMAT, MAGIC, lat_min, lon_min, resolution, rows, cols, len(BANDS))
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header.ljust(HEADER_SIZE, b"\0"))
+        stacked.tofile(f)
+    os.replace(tmp_path, path)
+
+
+def build_from_csv(csv_path: str, output_path: str, resolution: float) -> None:
+    # Rows of lat, lon, heat, humidity, wind, flood; cells without a row are stored as NaN
+    with open(csv_path, "r", newline="", encoding="utf-8") as f:
+        cells = [{key: float(value) for key, value in row.items()} for row in csv.DictReader(f)]
+    if not cells:
+        raise ValueError(f"{csv_path} has no hazard cells")
+    lats = np.array([cell["lat"] for cell in cells])
+    lons = np.array([cell["lon"] for cell in cells])
+    lat_min = np.floor(lats.min() / resolution) * resolution
+    lon_min = np.floor(lons.min() / resolution) * resolution
+    rows = np.floor((lats - lat_min) / resolution).astype(np.int64)
+    cols = np.floor((lons - lon_min) / resolution).astype(np.int64)
+
+    bands = {}
+    for name in BANDS:
+        band = np.full((rows.max() + 1, cols.max() + 1), np.nan, dtype="<f4")
+        band[rows, cols] = [cell[name] for cell in cells]
+        bands[name] = band
+    write_hazard_grid(output_path, float(lat_min), float(lon_min), resolution, bands)
+
+
+def load_hazard_grid(path: Optional[str] = None) -> Optional[HazardGrid]:
+    path = path or os.getenv("HAZARD_GRID_PATH")
+    if not path:
+        return None
+    if path not in _grid_cache:
+        _grid_cache[path] = HazardGrid(path)
+    return _grid_cache[path]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Build a memory-mapped climate hazard grid from a CSV of cells.")
+    parser.add_argument("csv", help="CSV with lat, lon, heat, humidity, wind and flood columns")
+    parser.add_argument("-o", "--output", required=True, help="grid file to write")
+    parser.add_argument("-r", "--resolution", type=float, default=0.25, help="cell size in degrees")
+    args = parser.parse_args(argv)
+
+    build_from_csv(args.csv, args.output, args.resolution)
+    grid = HazardGrid(args.output)
+    print(f"Wrote {grid.rows}x{grid.cols} grid at {grid.resolution} degrees to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -1,26 +1,246 @@
+import atexit
+import contextvars
+import copy
+import json
 import logging
+import multiprocessing
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+import random
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
-def setup_logger(name, log_file, level=logging.INFO):
-    formatter = logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s')
+LOG_DIR = 'logs'
+LOG_QUEUE_SIZE = 10000
+DEBUG_SAMPLE_RATE = 0.01
 
-    handler = RotatingFileHandler(log_file, maxBytes=10*1024*1024, backupCount=5)
-    handler.setFormatter(formatter)
+# Component loggers and the file each one writes to once logging is configured;
+# records from any other logger land in app.log
+LOG_FILES = {
+    'mga_analyst': 'mga_analyst.log',
+    'underwriting': 'underwriting.log',
+    'policy_management': 'policy_management.log',
+    'risk_exposure': 'risk_exposure.log',
+    'esg_compliance': 'esg_compliance.log',
+    'batch_runner': 'batch_runner.log',
+    'main': 'main.log'
+}
+FALLBACK_LOG_FILE = 'app.log'
 
-    logger = logging.getLogger(name)
-    logger.setLevel(level)
-    logger.addHandler(handler)
+_request_id = contextvars.ContextVar('request_id', default=None)
+_STANDARD_ATTRS = set(logging.LogRecord('', 0, '', 0, '', (), None).__dict__) | {'message', 'request_id'}
 
-    return logger
+_lock = threading.Lock()
+_configured_pid = None
+_queue_handler = None
+_listener = None
+_worker_queue = None
+_worker_listener = None
 
-# Set up loggers for each component
-mga_analyst_logger = setup_logger('mga_analyst', 'logs/mga_analyst.log')
-underwriting_logger = setup_logger('underwriting', 'logs/underwriting.log')
-policy_management_logger = setup_logger('policy_management', 'logs/policy_management.log')
-risk_exposure_logger = setup_logger('risk_exposure', 'logs/risk_exposure.log')
-esg_compliance_logger = setup_logger('esg_compliance', 'logs/esg_compliance.log')
-main_logger = setup_logger('main', 'logs/main.log')
 
-# Ensure the logs directory exists
-os.makedirs('logs', exist_ok=True)
\ No newline at end of file
+def get_request_id():
+    return _request_id.get()
+
+
+@contextmanager
+def request_context(request_id=None):
+    # Reuse an enclosing id so nested pipeline calls log under the same request
+    if request_id is None:
+        request_id = _request_id.get() or uuid.uuid4().hex
+    token = _request_id.set(request_id)
+    try:
+        yield request_id
+    finally:
+        _request_id.reset(token)
+
+
+class JSONFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'request_id': getattr(record, 'request_id', None),
+            'process': record.process,
+            'thread': record.threadName
+        }
+        for key, value in record.__dict__.items():
+            if key not in _STANDARD_ATTRS:
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exc_info'] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class ComponentFilter(logging.Filter):
+    # Matches 'underwriting' as well as module loggers such as 'agents.underwriting'
+    def __init__(self, component):
+        super().__init__()
+        self.component = component
+
+    def filter(self, record):
+        return record.name.split('.')[-1] == self.component or record.name.split('.')[0] == self.component
+
+
+class FallbackFilter(logging.Filter):
+    def __init__(self, components):
+        super().__init__()
+        self.component_filters = [ComponentFilter(c) for c in components]
+
+    def filter(self, record):
+        return not any(f.filter(record) for f in self.component_filters)
+
+
+class AsyncQueueHandler(QueueHandler):
+    # Runs on the caller's thread, so it only stamps the record and enqueues it; formatting and
+    # file I/O happen on the listener thread. DEBUG records are sampled, and a full queue drops
+    # records instead of blocking the request.
+    def __init__(self, log_queue, debug_sample_rate=DEBUG_SAMPLE_RATE):
+        super().__init__(log_queue)
+        self.debug_sample_rate = debug_sample_rate
+        self.enqueued = 0
+        self.dropped = 0
+        self.sampled_out = 0
+
+    def handle(self, record):
+        if record.levelno <= logging.DEBUG and random.random() >= self.debug_sample_rate:
+            self.sampled_out += 1
+            return False
+        record.request_id = _request_id.get()
+        return super().handle(record)
+
+    def prepare(self, record):
+        # Render the message once here so args referencing mutable state are captured now. Works on a
+        # copy, as QueueHandler.prepare does, so other handlers still see the original args and exc_info
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+            self.enqueued += 1
+        except queue.Full:
+            self.dropped += 1
+
+
+class DrainingQueueListener(QueueListener):
+    def enqueue_sentinel(self):
+        # The queue may be full at shutdown; wait for the writer to make room rather than fail
+        self.queue.put(self._sentinel)
+
+
+def configure_logging(log_dir=LOG_DIR, level=logging.INFO, debug_sample_rate=DEBUG_SAMPLE_RATE,
+                      queue_size=LOG_QUEUE_SIZE):
+    global _configured_pid, _queue_handler, _listener
+    with _lock:
+        # Keyed on the pid because a forked child inherits the flag but not the listener thread
+        if _configured_pid == os.getpid():
+            return
+        # Ensure the logs directory exists before any handler opens its file
+        os.makedirs(log_dir, exist_ok=True)
+        formatter = JSONFormatter()
+        file_handlers = []
+        for component, log_file in LOG_FILES.items():
+            handler = RotatingFileHandler(os.path.join(log_dir, log_file), maxBytes=10*1024*1024, backupCount=5)
+            handler.addFilter(ComponentFilter(component))
+            file_handlers.append(handler)
+        fallback = RotatingFileHandler(os.path.join(log_dir, FALLBACK_LOG_FILE), maxBytes=10*1024*1024, backupCount=5)
+        fallback.addFilter(FallbackFilter(LOG_FILES))
+        file_handlers.append(fallback)
+        for handler in file_handlers:
+            handler.setFormatter(formatter)
+
+        root = logging.getLogger()
+        if _queue_handler is not None:
+            root.removeHandler(_queue_handler)
+        log_queue = queue.Queue(maxsize=queue_size)
+        _queue_handler = AsyncQueueHandler(log_queue, debug_sample_rate)
+        root.addHandler(_queue_handler)
+        root.setLevel(level)
+
+        _listener = DrainingQueueListener(log_queue, *file_handlers, respect_handler_level=True)
+        _listener.start()
+        _configured_pid = os.getpid()
+
+
+def worker_log_queue(queue_size=LOG_QUEUE_SIZE):
+    # Worker processes send records here and the parent's file handlers write them, so every
+    # log file keeps a single writer (rotating one file from several processes loses records)
+    global _worker_queue, _worker_listener
+    with _lock:
+        if _listener is None or _configured_pid != os.getpid():
+            raise RuntimeError("configure_logging() must run in this process before starting workers")
+        if _worker_queue is None:
+            _worker_queue = multiprocessing.Queue(queue_size)
+            _worker_listener = DrainingQueueListener(_worker_queue, *_listener.handlers, respect_handler_level=True)
+            _worker_listener.start()
+        return _worker_queue
+
+
+def configure_worker_logging(log_queue, level=logging.INFO, debug_sample_rate=DEBUG_SAMPLE_RATE):
+    # Runs in the worker: no file handlers, only a queue handler feeding the parent's writer
+    global _configured_pid, _queue_handler, _listener
+    with _lock:
+        if _configured_pid == os.getpid():
+            return
+        root = logging.getLogger()
+        if _queue_handler is not None:
+            root.removeHandler(_queue_handler)
+        _queue_handler = AsyncQueueHandler(log_queue, debug_sample_rate)
+        root.addHandler(_queue_handler)
+        root.setLevel(level)
+        _listener = None
+        _configured_pid = os.getpid()
+
+
+def shutdown_logging():
+    global _configured_pid, _listener, _worker_queue, _worker_listener
+    with _lock:
+        if _listener is not None and _configured_pid == os.getpid():
+            # Drains everything already queued, from this process and its workers, before closing the files
+            if _worker_listener is not None:
+                _worker_listener.stop()
+                _worker_queue.close()
+                _worker_queue.join_thread()
+            _listener.stop()
+            for handler in _listener.handlers:
+                handler.close()
+        if _queue_handler is not None:
+            logging.getLogger().removeHandler(_queue_handler)
+        _listener = None
+        _worker_queue = None
+        _worker_listener = None
+        _configured_pid = None
+
+
+def logging_stats():
+    if _queue_handler is None:
+        return {'enqueued': 0, 'dropped': 0, 'sampled_out': 0, 'queue_depth': 0}
+    return {
+        'enqueued': _queue_handler.enqueued,
+        'dropped': _queue_handler.dropped,
+        'sampled_out': _queue_handler.sampled_out,
+        'queue_depth': _queue_handler.queue.qsize()
+    }
+
+
+atexit.register(shutdown_logging)
+
+# Loggers are handed out at import time but only reach a file once configure_logging() has run
+mga_analyst_logger = logging.getLogger('mga_analyst')
+underwriting_logger = logging.getLogger('underwriting')
+policy_management_logger = logging.getLogger('policy_management')
+risk_exposure_logger = logging.getLogger('risk_exposure')
+esg_compliance_logger = logging.getLogger('esg_compliance')
+main_logger = logging.getLogger('main')
\ No newline at end of file
@@ -1,13 +1,21 @@
-from crewai import Crew, Task
-from agents.mga_analyst import MGAAnalyst
-from agents.underwriting import Underwriting
-from agents.policy_management import PolicyManagement
-from agents.risk_exposure import RiskExposure
-from agents.esg_compliance import ESGCompliance
-from ui.gradio_interface import create_interface
+import os
+from bootstrap import initialize
+from pipeline import AnalysisPipeline
+from result_cache import ResultCache, config_fingerprint
+from router import RequestRouter
 from logger import main_logger
+from telemetry import telemetry
 
+# crewai, the agents and the UI stack are imported inside the functions that need them
+# so that headless workers and tests never pay for (or require) gradio
 def create_crew():
+    from crewai import Crew, Task
+    from agents.mga_analyst import MGAAnalyst
+    from agents.underwriting import Underwriting
+    from agents.policy_management import PolicyManagement
+    from agents.risk_exposure import RiskExposure
+    from agents.esg_compliance import ESGCompliance
+
     mga_analyst = MGAAnalyst()
     underwriting = Underwriting()
     policy_management = PolicyManagement()
@@ -41,16 +49,32 @@ def create_crew():
                 description="Compile final summary",
                 agent=mga_analyst
             )
-        ]
+        ],
+        task_callback=telemetry.task_callback,
+        step_callback=telemetry.step_callback
     )
 
     return crew
 
+def build_pipeline():
+    crew = create_crew()
+    import hazard_grid
+    import router as routing_rules
+    import support_responses
+    # Climate thresholds, the hazard raster and the routing rules all shape cached answers
+    fingerprint = config_fingerprint(crew.agents, crew.tasks,
+                                     modules=(hazard_grid, routing_rules, support_responses),
+                                     data_files=(os.getenv("HAZARD_GRID_PATH"),))
+    cache = ResultCache.from_env(fingerprint=fingerprint)
+    request_router = RequestRouter.from_crew(crew)
+    return AnalysisPipeline(crew, cache=cache, router=request_router)
+
 def main():
+    initialize()
     main_logger.info("Starting the InsurTech Agentic Workflow System")
     try:
-        crew = create_crew()
-        interface = create_interface(crew)
+        from ui.gradio_interface import create_interface
+        interface = create_interface(build_pipeline())
         main_logger.info("Launching Gradio interface")
         interface.launch()
     except Exception as e:
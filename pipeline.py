@@ -0,0 +1,65 @@
+import io
+import logging
+from typing import Optional
+from logger import request_context
+from result_cache import ResultCache, file_digest
+from router import RequestRouter
+from telemetry import span, telemetry
+
+def read_file_content(path: Optional[str]) -> str:
+    if not path:
+        return ""
+    # pandas and PyPDF2 are only imported for the file types that need them
+    if path.endswith('.csv'):
+        import pandas as pd
+        return pd.read_csv(path).to_string()
+    elif path.endswith('.xlsx'):
+        import pandas as pd
+        return pd.read_excel(path).to_string()
+    elif path.endswith('.pdf'):
+        import PyPDF2
+        with open(path, 'rb') as f:
+            pdf_reader = PyPDF2.PdfReader(io.BytesIO(f.read()))
+        return "\n".join([page.extract_text() for page in pdf_reader.pages])
+    else:
+        with open(path, 'rb') as f:
+            return f.read().decode('utf-8')
+
+class AnalysisPipeline:
+    def __init__(self, crew, cache: Optional[ResultCache] = None, router: Optional[RequestRouter] = None):
+        self.crew = crew
+        self.cache = cache
+        self.router = router
+        self.logger = logging.getLogger(__name__)
+
+    def run(self, input_text: str, file_path: Optional[str] = None, request_id: Optional[str] = None) -> str:
+        with request_context(request_id), span("pipeline.run", kind="request") as request_span:
+            if self.cache is None:
+                return self._analyze(input_text, file_path, request_span)
+            computed = []
+
+            def compute():
+                computed.append(True)
+                return self._analyze(input_text, file_path, request_span)
+
+            with span("file_digest", kind="internal"):
+                digest = file_digest(file_path)
+            result = self.cache.get_or_compute(input_text, digest, compute)
+            request_span.set("cache", "miss" if computed else "hit")
+            return result
+
+    def _analyze(self, input_text: str, file_path: Optional[str], request_span) -> str:
+        with span("read_file_content", kind="internal"):
+            file_content = read_file_content(file_path)
+
+        if self.router is not None:
+            decision = self.router.route(input_text, file_content)
+            request_span.set("route", decision.route)
+            if not decision.escalated:
+                return decision.answer
+
+        # Process the input and file using the crew
+        with span("crew.kickoff", kind="crew"):
+            telemetry.start_task_clock()
+            result = self.crew.kickoff(input_text=input_text, file_content=file_content)
+        return str(result)
\ No newline at end of file
@@ -1,5 +1,7 @@
 import logging
 from crewai import Agent
+from support_responses import support_response
+from telemetry import traced
 from typing import Dict, Any
 
 class PolicyManagement(Agent):
@@ -11,6 +13,7 @@ class PolicyManagement(Agent):
         )
         self.logger = logging.getLogger(__name__)
 
+    @traced(kind="agent")
     def administer_policy(self, policy_data: Dict[str, Any]) -> Dict[str, Any]:
         self.logger.info("Administering policy")
         try:
@@ -29,6 +32,7 @@ class PolicyManagement(Agent):
             self.logger.error(f"Error during policy administration: {str(e)}")
             raise
 
+    @traced(kind="agent")
     def manage_claim(self, claim_data: Dict[str, Any]) -> Dict[str, Any]:
         self.logger.info("Managing claim")
         try:
@@ -47,6 +51,7 @@ class PolicyManagement(Agent):
             self.logger.error(f"Error during claim management: {str(e)}")
             raise
 
+    @traced(kind="agent")
     def provide_customer_support(self, customer_query: str) -> str:
         self.logger.info("Providing customer support")
         try:
@@ -92,10 +97,4 @@ class PolicyManagement(Agent):
         return min(claimed_amount, coverage_limit)
 
     def _generate_support_response(self, customer_query: str) -> str:
-        # Implement support response generation logic
-        if "policy" in customer_query.lower():
-            return "Your policy details can be found in your account dashboard. For specific questions, please provide your policy number."
-        elif "claim" in customer_query.lower():
-            return "To file a claim, please visit our claims portal or call our 24/7 claims hotline at 1-800-123-4567."
-        else:
-            return "Thank you for your query. A customer support representative will get back to you within 24 hours."
\ No newline at end of file
+        return support_response(customer_query)
\ No newline at end of file
@@ -0,0 +1,227 @@
+import hashlib
+import inspect
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+DEFAULT_TTL_SECONDS = 6 * 60 * 60
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_DISK_ENTRIES = 4096
+
+# Bumped by hand whenever rating thresholds change outside the agent modules
+RATING_TABLES_VERSION = "1"
+
+_EMPTY_DIGEST = hashlib.sha256(b"").hexdigest()
+
+
+def normalize_query(input_text: Optional[str]) -> str:
+    return re.sub(r"\s+", " ", (input_text or "").strip().lower())
+
+
+def file_digest(path: Optional[str], chunk_size: int = 1024 * 1024) -> str:
+    if not path:
+        return _EMPTY_DIGEST
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def config_fingerprint(agents: Iterable[Any], tasks: Iterable[Any] = (),
+                       rating_tables_version: str = RATING_TABLES_VERSION,
+                       modules: Iterable[Any] = (), data_files: Iterable[Optional[str]] = ()) -> str:
+    # Rating thresholds live in the agent classes themselves, so their source is part of the fingerprint;
+    # modules holding thresholds or routing rules outside the agents, and data files such as the
+    # hazard grid, are passed in explicitly
+    digest = hashlib.sha256(rating_tables_version.encode("utf-8"))
+    seen_classes = set()
+    for agent in agents:
+        for attr in ("role", "goal", "backstory"):
+            digest.update(str(getattr(agent, attr, "")).encode("utf-8"))
+        cls = type(agent)
+        if cls not in seen_classes:
+            seen_classes.add(cls)
+            try:
+                digest.update(inspect.getsource(cls).encode("utf-8"))
+            except (OSError, TypeError):
+                digest.update(cls.__qualname__.encode("utf-8"))
+    for task in tasks:
+        digest.update(str(getattr(task, "description", "")).encode("utf-8"))
+    for module in modules:
+        try:
+            digest.update(inspect.getsource(module).encode("utf-8"))
+        except (OSError, TypeError):
+            digest.update(module.__name__.encode("utf-8"))
+    for path in data_files:
+        digest.update(_file_identity(path).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _file_identity(path: Optional[str]) -> str:
+    # Path, size and mtime rather than a content hash: data files can be gigabytes
+    if not path or not os.path.exists(path):
+        return ""
+    stat = os.stat(path)
+    return f"{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+class ResultCache:
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 disk_dir: Optional[str] = None, max_disk_entries: int = DEFAULT_MAX_DISK_ENTRIES,
+                 fingerprint: str = "", clock: Callable[[], float] = time.time):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self.max_disk_entries = max_disk_entries
+        self.fingerprint = fingerprint
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, str, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.logger = logging.getLogger(__name__)
+        if self.disk_dir:
+            os.makedirs(self.disk_dir, exist_ok=True)
+
+    @classmethod
+    def from_env(cls, fingerprint: str = "") -> "ResultCache":
+        return cls(
+            ttl_seconds=float(os.getenv("RESULT_CACHE_TTL", DEFAULT_TTL_SECONDS)),
+            max_entries=int(os.getenv("RESULT_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+            disk_dir=os.getenv("RESULT_CACHE_DIR") or None,
+            max_disk_entries=int(os.getenv("RESULT_CACHE_MAX_DISK_ENTRIES", DEFAULT_MAX_DISK_ENTRIES)),
+            fingerprint=fingerprint
+        )
+
+    @staticmethod
+    def make_key(input_text: Optional[str], digest: str = _EMPTY_DIGEST) -> str:
+        return hashlib.sha256(f"{normalize_query(input_text)}\x00{digest}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if self._is_fresh(entry[0], entry[1], now):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[2]
+                del self._entries[key]
+
+        entry = self._read_disk(key)
+        if entry is not None:
+            if self._is_fresh(entry[0], entry[1], now):
+                with self._lock:
+                    self._store_memory(key, entry)
+                    self.hits += 1
+                return entry[2]
+            self._remove_disk(key)
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, key: str, result: str) -> None:
+        entry = (self._clock(), self.fingerprint, result)
+        with self._lock:
+            self._store_memory(key, entry)
+        self._write_disk(key, entry)
+
+    def get_or_compute(self, input_text: Optional[str], digest: str, compute: Callable[[], Any]) -> str:
+        key = self.make_key(input_text, digest)
+        cached = self.get(key)
+        if cached is not None:
+            self.logger.info(f"Result cache hit for key {key[:12]}")
+            return cached
+        self.logger.info(f"Result cache miss for key {key[:12]}")
+        result = str(compute())
+        self.set(key, result)
+        return result
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+        self._remove_disk(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        if self.disk_dir:
+            for name in os.listdir(self.disk_dir):
+                if name.endswith(".json"):
+                    os.remove(os.path.join(self.disk_dir, name))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0
+            }
+
+    def _is_fresh(self, stored_at: float, fingerprint: str, now: float) -> bool:
+        # Entries computed under a different rating/agent configuration are stale regardless of age
+        return fingerprint == self.fingerprint and now - stored_at < self.ttl_seconds
+
+    def _store_memory(self, key: str, entry: Tuple[float, str, str]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, f"{key}.json")
+
+    def _read_disk(self, key: str) -> Optional[Tuple[float, str, str]]:
+        if not self.disk_dir:
+            return None
+        try:
+            with open(self._disk_path(key), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data["stored_at"], data["fingerprint"], data["result"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            self.logger.error(f"Discarding unreadable cache entry {key[:12]}: {str(e)}")
+            self._remove_disk(key)
+            return None
+
+    def _write_disk(self, key: str, entry: Tuple[float, str, str]) -> None:
+        if not self.disk_dir:
+            return
+        path = self._disk_path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"stored_at": entry[0], "fingerprint": entry[1], "result": entry[2]}, f)
+            os.replace(tmp_path, path)
+            self._prune_disk()
+        except OSError as e:
+            self.logger.error(f"Failed to persist cache entry {key[:12]}: {str(e)}")
+
+    def _prune_disk(self) -> None:
+        entries = [e for e in os.scandir(self.disk_dir) if e.name.endswith(".json")]
+        if len(entries) <= self.max_disk_entries:
+            return
+        entries.sort(key=lambda e: e.stat().st_mtime)
+        for entry in entries[:len(entries) - self.max_disk_entries]:
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass
+
+    def _remove_disk(self, key: str) -> None:
+        if not self.disk_dir:
+            return
+        try:
+            os.remove(self._disk_path(key))
+        except FileNotFoundError:
+            pass
\ No newline at end of file
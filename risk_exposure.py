@@ -1,5 +1,6 @@
 import logging
 from crewai import Agent
+from telemetry import traced
 from typing import Dict, Any, List
 
 class RiskExposure(Agent):
@@ -11,6 +12,7 @@ class RiskExposure(Agent):
         )
         self.logger = logging.getLogger(__name__)
 
+    @traced(kind="agent")
     def calculate_portfolio_exposure(self, portfolio_data: List[Dict[str, Any]]) -> Dict[str, float]:
         self.logger.info("Calculating portfolio exposure")
         try:
@@ -29,6 +31,7 @@ class RiskExposure(Agent):
             self.logger.error(f"Error during portfolio exposure calculation: {str(e)}")
             raise
 
+    @traced(kind="agent")
     def analyze_risk_factors(self, policy_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         self.logger.info("Analyzing risk factors")
         try:
@@ -44,6 +47,7 @@ class RiskExposure(Agent):
             self.logger.error(f"Error during risk factor analysis: {str(e)}")
             raise
 
+    @traced(kind="agent")
     def generate_risk_report(self, exposure_data: Dict[str, float], risk_factors: List[Dict[str, Any]]) -> str:
         self.logger.info("Generating risk report")
         try:
@@ -57,12 +61,7 @@ class RiskExposure(Agent):
 
             Risk Factors:
             """
-            for factor in risk_factors:
-                report += f"- {factor['name']}: {factor['level']} (Score: {factor['score']})\n"
-                report += f"  {factor['description']}\n\n"
-
-            overall_risk_score = sum(factor['score'] for factor in risk_factors) / len(risk_factors)
-            report += f"\nOverall Risk Score: {overall_risk_score:.2f} out of 5.00"
+            report += self._format_risk_factors(risk_factors)
 
             self.logger.info("Risk report generated successfully")
             return report
@@ -108,4 +107,14 @@ class RiskExposure(Agent):
         elif coverage_amount > 500000:
             return {"name": "Coverage Limits", "level": "Medium", "score": 3.0, "description": "Moderate coverage limits with balanced exposure"}
         else:
-            return {"name": "Coverage Limits", "level": "Low", "score": 2.0, "description": "Low coverage limits minimize potential exposure"}
\ No newline at end of file
+            return {"name": "Coverage Limits", "level": "Low", "score": 2.0, "description": "Low coverage limits minimize potential exposure"}
+
+    def _format_risk_factors(self, risk_factors: List[Dict[str, Any]]) -> str:
+        report = ""
+        for factor in risk_factors:
+            report += f"- {factor['name']}: {factor['level']} (Score: {factor['score']})\n"
+            report += f"  {factor['description']}\n\n"
+
+        overall_risk_score = sum(factor['score'] for factor in risk_factors) / len(risk_factors)
+        report += f"\nOverall Risk Score: {overall_risk_score:.2f} out of 5.00"
+        return report
\ No newline at end of file
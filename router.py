@@ -0,0 +1,127 @@
+import json
+import logging
+import re
+import threading
+import time
+from typing import Any, Dict, Optional
+from support_responses import is_support_question
+
+ROUTE_SUPPORT = "support"
+ROUTE_RISK_FACTORS = "risk_factors"
+ROUTE_FRAUD_CHECK = "fraud_check"
+ROUTE_CREW = "crew"
+
+RISK_FIELDS = {"location", "industry", "previous_claims", "coverage_amount"}
+FRAUD_FIELDS = {"claims_history", "credit_score", "age"}
+RISK_QUERY = re.compile(r"\brisk\b")
+FRAUD_QUERY = re.compile(r"\bfraud\b")
+
+
+class RouteDecision:
+    def __init__(self, route: str, answer: Optional[str] = None, reason: str = ""):
+        self.route = route
+        self.answer = answer
+        self.reason = reason
+
+    @property
+    def escalated(self) -> bool:
+        return self.answer is None
+
+
+class RequestRouter:
+    def __init__(self, policy_management, risk_exposure, underwriting):
+        self.policy_management = policy_management
+        self.risk_exposure = risk_exposure
+        self.underwriting = underwriting
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._counts: Dict[str, int] = {}
+        self._fallbacks = 0
+        self._deterministic_seconds = 0.0
+
+    @classmethod
+    def from_crew(cls, crew) -> "RequestRouter":
+        agents = {type(agent).__name__: agent for agent in crew.agents}
+        return cls(agents["PolicyManagement"], agents["RiskExposure"], agents["Underwriting"])
+
+    def classify(self, input_text: str, file_content: str = "") -> str:
+        query = (input_text or "").strip().lower()
+        payload = _parse_payload(file_content) or _parse_payload(input_text)
+
+        if payload is not None:
+            # The rule methods default any missing field, so only a complete payload is rule-answerable
+            if FRAUD_QUERY.search(query) and FRAUD_FIELDS <= payload.keys():
+                return ROUTE_FRAUD_CHECK
+            if RISK_QUERY.search(query) and RISK_FIELDS <= payload.keys():
+                return ROUTE_RISK_FACTORS
+            return ROUTE_CREW
+
+        if not file_content and is_support_question(query):
+            return ROUTE_SUPPORT
+        return ROUTE_CREW
+
+    def route(self, input_text: str, file_content: str = "") -> RouteDecision:
+        started = time.perf_counter()
+        route = self.classify(input_text, file_content)
+        decision = RouteDecision(route, reason="not rule-answerable")
+
+        if route != ROUTE_CREW:
+            try:
+                decision.answer = self._answer(route, input_text, file_content)
+                decision.reason = "answered by rule-based agent methods"
+            except Exception as e:
+                self.logger.error(f"Deterministic {route} route failed, escalating to crew: {str(e)}")
+                decision = RouteDecision(ROUTE_CREW, reason=f"{route} fallback: {str(e)}")
+
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self._counts[decision.route] = self._counts.get(decision.route, 0) + 1
+            if decision.route != route:
+                self._fallbacks += 1
+            if not decision.escalated:
+                self._deterministic_seconds += elapsed
+        self.logger.info(f"Routed request to {decision.route} ({decision.reason}) in {elapsed * 1000:.2f} ms")
+        return decision
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = sum(self._counts.values())
+            deterministic = total - self._counts.get(ROUTE_CREW, 0)
+            return {
+                "total": total,
+                "routes": dict(self._counts),
+                "deterministic": deterministic,
+                "escalated": self._counts.get(ROUTE_CREW, 0),
+                "fallbacks": self._fallbacks,
+                "hit_rate": deterministic / total if total else 0.0,
+                "avg_deterministic_ms": self._deterministic_seconds * 1000 / deterministic if deterministic else 0.0
+            }
+
+    def _answer(self, route: str, input_text: str, file_content: str) -> str:
+        if route == ROUTE_SUPPORT:
+            return self.policy_management._generate_support_response(input_text)
+
+        payload = _parse_payload(file_content) or _parse_payload(input_text)
+        if route == ROUTE_RISK_FACTORS:
+            risk_factors = self.risk_exposure.analyze_risk_factors(payload)
+            return "Risk Factors\n\n" + self.risk_exposure._format_risk_factors(risk_factors)
+
+        # Only the rule outcome is reported; a coverage recommendation needs the crew's risk evaluation
+        pattern_count = self.underwriting._check_suspicious_patterns(payload)
+        suspected = pattern_count > self.underwriting.FRAUD_PATTERN_THRESHOLD
+        return (
+            f"Fraud Check\n\n"
+            f"- Suspicious patterns found: {pattern_count} (threshold: {self.underwriting.FRAUD_PATTERN_THRESHOLD})\n"
+            f"- Suspected fraud: {'Yes' if suspected else 'No'}"
+        )
+
+
+def _parse_payload(text: Optional[str]) -> Optional[Dict[str, Any]]:
+    text = (text or "").strip()
+    if not text.startswith("{"):
+        return None
+    try:
+        payload = json.loads(text)
+    except ValueError:
+        return None
+    return payload if isinstance(payload, dict) else None
\ No newline at end of file
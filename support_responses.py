@@ -0,0 +1,42 @@
+import re
+from typing import List
+
+# Keyword -> canned reply, checked in order; PolicyManagement answers with the first keyword found
+SUPPORT_RESPONSES = [
+    ("policy", "Your policy details can be found in your account dashboard. For specific questions, please provide your policy number."),
+    ("claim", "To file a claim, please visit our claims portal or call our 24/7 claims hotline at 1-800-123-4567.")
+]
+DEFAULT_SUPPORT_RESPONSE = "Thank you for your query. A customer support representative will get back to you within 24 hours."
+
+# Questions the canned reply for each keyword actually answers
+SUPPORT_PATTERNS = {
+    "policy": [
+        re.compile(r"\b(where|how) (can|do|should) i (find|see|view|check|access|get) my policy( (number|details|documents?))?\??$"),
+        re.compile(r"\bmy policy (number|details|documents?)\b")
+    ],
+    "claim": [
+        re.compile(r"\b(file|submit|report|open|make) an? (new )?claim\b"),
+        re.compile(r"\bclaims? (portal|hotline|phone number)\b")
+    ]
+}
+
+
+def support_intents(query: str) -> List[str]:
+    query = (query or "").lower()
+    return [keyword for keyword, _ in SUPPORT_RESPONSES if keyword in query]
+
+
+def support_response(query: str) -> str:
+    intents = support_intents(query)
+    if not intents:
+        return DEFAULT_SUPPORT_RESPONSE
+    return dict(SUPPORT_RESPONSES)[intents[0]]
+
+
+def is_support_question(query: str) -> bool:
+    # Only a query with a single intent gets the canned reply; "claim on my policy" mixes both
+    query = (query or "").strip().lower()
+    intents = support_intents(query)
+    if len(intents) != 1:
+        return False
+    return any(pattern.search(query) for pattern in SUPPORT_PATTERNS[intents[0]])
\ No newline at end of file
@@ -0,0 +1,121 @@
+import random
+from datetime import date, timedelta
+from typing import Any, Dict, List
+
+INDUSTRIES = ["construction", "manufacturing", "retail", "hospitality", "technology", "healthcare", "logistics"]
+LOCATIONS = [
+    ("Miami, coastal area", 25.76, -80.19),
+    ("New Orleans, flood zone", 29.95, -90.07),
+    ("Denver", 39.74, -104.99),
+    ("Chicago", 41.88, -87.63),
+    ("Houston, flood zone", 29.76, -95.37),
+    ("San Diego, coastal area", 32.72, -117.16),
+    ("Phoenix", 33.45, -112.07),
+    ("Boston, coastal area", 42.36, -71.06)
+]
+ESG_PHRASES = [
+    "renewable energy", "waste reduction", "carbon neutral", "diversity", "employee welfare",
+    "community engagement", "board diversity", "transparency", "ethical business practices",
+    "quarterly earnings", "new product launch", "supply chain update"
+]
+
+# Every generator takes a seed so benchmark runs see identical inputs
+
+
+def generate_portfolio(size: int, seed: int = 0) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    portfolio = []
+    for i in range(size):
+        location, _, _ = rng.choice(LOCATIONS)
+        portfolio.append({
+            "policy_id": f"POL-{i:07d}",
+            "location": location,
+            "industry": rng.choice(INDUSTRIES),
+            "previous_claims": rng.choices([0, 1, 2, 3, 4, 6], weights=[50, 20, 12, 8, 6, 4])[0],
+            "coverage_amount": round(rng.lognormvariate(13, 0.8), 2),
+            "risk_factor": round(rng.uniform(0.7, 2.5), 2)
+        })
+    return portfolio
+
+
+def generate_applicants(size: int, seed: int = 0) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    return [
+        {
+            "applicant_id": f"APP-{i:07d}",
+            "age": rng.randint(18, 80),
+            "credit_score": int(rng.gauss(680, 90)),
+            "claims_history": rng.choices([0, 1, 2, 4, 6, 9], weights=[45, 20, 15, 10, 6, 4])[0],
+            "coverage_amount": round(rng.lognormvariate(13, 1.0), 2)
+        }
+        for i in range(size)
+    ]
+
+
+def generate_claims(size: int, seed: int = 0) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    claims = []
+    for i in range(size):
+        policy_end = date(2024, 1, 1) + timedelta(days=rng.randint(0, 730))
+        claims.append({
+            "claim_id": f"CLM-{i:07d}",
+            "incident_date": policy_end + timedelta(days=rng.randint(-365, 30)),
+            "policy_end_date": policy_end,
+            "claimed_amount": round(rng.lognormvariate(9, 1.2), 2),
+            "coverage_limit": rng.choice([50000, 100000, 250000, 500000])
+        })
+    return claims
+
+
+def generate_esg_search_results(companies: int, results_per_company: int = 10,
+                                seed: int = 0) -> List[List[Dict[str, str]]]:
+    # Shaped like GoogleSearchTool.search() items: one list of results per company
+    rng = random.Random(seed)
+    return [
+        [
+            {
+                "title": f"Company {c} sustainability update {r}",
+                "link": f"https://example.com/company-{c}/{r}",
+                "snippet": f"Company {c} reports progress on {' and '.join(rng.sample(ESG_PHRASES, rng.randint(1, 3)))}."
+            }
+            for r in range(results_per_company)
+        ]
+        for c in range(companies)
+    ]
+
+
+def generate_companies(size: int, seed: int = 0) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    companies = []
+    for i in range(size):
+        location, lat, lon = rng.choice(LOCATIONS)
+        companies.append({
+            "name": f"Company {i}",
+            "location": location.split(",")[0],
+            "lat": round(lat + rng.uniform(-0.5, 0.5), 4),
+            "lon": round(lon + rng.uniform(-0.5, 0.5), 4),
+            "industry": rng.choice(INDUSTRIES),
+            "size": rng.randint(1000, 200000),
+            "revenue": round(rng.uniform(0.5, 500.0), 2)
+        })
+    return companies
+
+
+def generate_weather(seed: int = 0) -> Dict[str, Any]:
+    # Shaped like the OpenWeather current-weather response used by ESGCompliance
+    rng = random.Random(seed)
+    return {
+        "main": {"temp": round(rng.uniform(-5, 40), 1), "humidity": rng.randint(20, 100)},
+        "wind": {"speed": round(rng.uniform(0, 20), 1)}
+    }
+
+def generate_hazard_bands(rows: int, cols: int, seed: int = 0):
+    # Long-run hazard indices in the band layout hazard_grid expects
+    import numpy as np
+    rng = np.random.default_rng(seed)
+    return {
+        "heat": rng.normal(24, 6, (rows, cols)).astype("<f4"),
+        "humidity": rng.uniform(20, 95, (rows, cols)).astype("<f4"),
+        "wind": rng.gamma(4, 2, (rows, cols)).astype("<f4"),
+        "flood": rng.beta(1, 4, (rows, cols)).astype("<f4")
+    }
\ No newline at end of file
@@ -0,0 +1,203 @@
+import bisect
+import contextvars
+import functools
+import json
+import math
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from logger import get_request_id
+
+METRIC_PREFIX = "insurcap"
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+DEFAULT_MAX_TRACES = 1000
+
+_current_span = contextvars.ContextVar("current_span", default=None)
+_task_clock = contextvars.ContextVar("task_clock", default=None)
+
+
+class Span:
+    def __init__(self, name: str, kind: str, request_id: Optional[str] = None, parent_id: Optional[str] = None,
+                 attributes: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.kind = kind
+        self.request_id = request_id
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent_id
+        self.start = time.time()
+        self.duration = 0.0
+        self.status = "ok"
+        self.attributes = dict(attributes or {})
+
+    def set(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "request_id": self.request_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start": self.start,
+            "duration_ms": round(self.duration * 1000, 3),
+            "status": self.status,
+            "attributes": self.attributes
+        }
+
+
+class Telemetry:
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS, max_traces: int = DEFAULT_MAX_TRACES):
+        self.buckets = tuple(sorted(buckets))
+        self.max_traces = max_traces
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            # (kind, name) -> [per-bucket counts (last one is +Inf), sum, count]
+            self._histograms: Dict[Tuple[str, str], List[Any]] = {}
+            self._counters: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = {}
+            self._traces: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+
+    @contextmanager
+    def span(self, name: str, kind: str = "internal", **attributes):
+        parent = _current_span.get()
+        span = Span(name, kind, get_request_id(), parent.span_id if parent else None, attributes)
+        token = _current_span.set(span)
+        started = time.perf_counter()
+        try:
+            yield span
+        except Exception as e:
+            span.status = "error"
+            span.set("error", str(e))
+            raise
+        finally:
+            span.duration = time.perf_counter() - started
+            _current_span.reset(token)
+            self.record(span.to_dict())
+
+    def traced(self, name: Optional[str] = None, kind: str = "internal"):
+        def decorator(func: Callable) -> Callable:
+            span_name = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(span_name, kind):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def record(self, span: Dict[str, Any]) -> None:
+        duration = span["duration_ms"] / 1000
+        attributes = span.get("attributes", {})
+        with self._lock:
+            histogram = self._histograms.setdefault(
+                (span["kind"], span["name"]), [[0] * (len(self.buckets) + 1), 0.0, 0]
+            )
+            histogram[0][bisect.bisect_left(self.buckets, duration)] += 1
+            histogram[1] += duration
+            histogram[2] += 1
+            if span["status"] != "ok":
+                self._increment("span_errors", kind=span["kind"], name=span["name"])
+            if "cache" in attributes:
+                self._increment("cache_lookups", result=attributes["cache"])
+            if "route" in attributes:
+                self._increment("routes", route=attributes["route"])
+            if span.get("request_id"):
+                trace = self._traces.setdefault(span["request_id"], [])
+                trace.append(span)
+                self._traces.move_to_end(span["request_id"])
+                while len(self._traces) > self.max_traces:
+                    self._traces.popitem(last=False)
+
+    def ingest(self, spans: List[Dict[str, Any]]) -> None:
+        # Spans recorded in another process (e.g. a batch pool worker) are folded into this registry
+        for span in spans:
+            self.record(span)
+
+    def increment(self, metric: str, amount: float = 1, **labels) -> None:
+        with self._lock:
+            self._increment(metric, amount, **labels)
+
+    def start_task_clock(self) -> None:
+        _task_clock.set(time.perf_counter())
+
+    def task_callback(self, output: Any) -> None:
+        # crewai only reports task completion, so each task is timed from the previous one finishing
+        started = _task_clock.get()
+        if started is None:
+            return
+        now = time.perf_counter()
+        _task_clock.set(now)
+        parent = _current_span.get()
+        span = Span(f"task:{str(getattr(output, 'description', 'unknown'))[:60]}", "task", get_request_id(),
+                    parent.span_id if parent else None, {"agent": str(getattr(output, "agent", ""))})
+        span.start = time.time() - (now - started)
+        span.duration = now - started
+        self.record(span.to_dict())
+
+    def step_callback(self, step: Any) -> None:
+        self.increment("agent_steps")
+
+    def trace(self, request_id: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._traces.get(request_id, []))
+
+    def trace_json(self, request_id: str) -> str:
+        return json.dumps({"request_id": request_id, "spans": self.trace(request_id)}, indent=2)
+
+    def render_openmetrics(self) -> str:
+        with self._lock:
+            histograms = {key: (list(v[0]), v[1], v[2]) for key, v in self._histograms.items()}
+            counters = dict(self._counters)
+
+        lines = []
+        metric = f"{METRIC_PREFIX}_span_duration_seconds"
+        lines.append(f"# TYPE {metric} histogram")
+        lines.append(f"# UNIT {metric} seconds")
+        lines.append(f"# HELP {metric} Latency of crew kickoffs, tasks, agent methods, tool calls and external requests.")
+        for (kind, name), (bucket_counts, total, count) in sorted(histograms.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), bucket_counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == math.inf else repr(bound)
+                lines.append(f"{metric}_bucket{_labels(kind=kind, name=name, le=le)} {cumulative}")
+            lines.append(f"{metric}_sum{_labels(kind=kind, name=name)} {total}")
+            lines.append(f"{metric}_count{_labels(kind=kind, name=name)} {count}")
+
+        for counter in sorted({name for name, _ in counters}):
+            lines.append(f"# TYPE {METRIC_PREFIX}_{counter} counter")
+            for (name, labels), value in sorted(counters.items()):
+                if name == counter:
+                    lines.append(f"{METRIC_PREFIX}_{counter}_total{_labels(**dict(labels))} {value}")
+
+        hits = counters.get(("cache_lookups", (("result", "hit"),)), 0)
+        misses = counters.get(("cache_lookups", (("result", "miss"),)), 0)
+        lines.append(f"# TYPE {METRIC_PREFIX}_cache_hit_ratio gauge")
+        lines.append(f"{METRIC_PREFIX}_cache_hit_ratio {hits / (hits + misses) if hits + misses else 0.0}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def _increment(self, metric: str, amount: float = 1, **labels) -> None:
+        key = (metric, tuple(sorted((k, str(v)) for k, v in labels.items())))
+        self._counters[key] = self._counters.get(key, 0) + amount
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+# Process-wide registry used by the agents, tools and pipeline
+telemetry = Telemetry()
+span = telemetry.span
+traced = telemetry.traced
\ No newline at end of file
@@ -0,0 +1,98 @@
+import json
+import os
+import tempfile
+import unittest
+import batch_runner
+
+class FakePipeline:
+    def __init__(self):
+        self.calls = []
+
+    def run(self, input_text, file_path=None, request_id=None):
+        self.calls.append(input_text)
+        if "fail" in input_text:
+            raise ValueError("bad submission")
+        return f"analysis of {input_text}"
+
+class TestBatchRunner(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.input_path = os.path.join(self.tmp.name, "submissions.jsonl")
+        self.output_path = os.path.join(self.tmp.name, "results.jsonl")
+        with open(self.input_path, "w") as f:
+            f.write(json.dumps({"request_id": "a", "input_text": "quote for a bakery"}) + "\n")
+            f.write(json.dumps({"request_id": "b", "title": "Fleet", "body": "please fail"}) + "\n")
+            f.write(json.dumps({"request_id": "c", "input_text": "quote for a warehouse"}) + "\n")
+        self.pipeline = FakePipeline()
+        batch_runner._worker_pipeline = self.pipeline
+
+    def tearDown(self):
+        batch_runner._worker_pipeline = None
+        self.tmp.cleanup()
+
+    def read_output(self):
+        with open(self.output_path) as f:
+            return [json.loads(line) for line in f]
+
+    def test_results_are_streamed_with_summary(self):
+        summary = batch_runner.run_batch(self.input_path, self.output_path)
+
+        records = self.read_output()
+        self.assertEqual([r["status"] for r in records], ["ok", "error", "ok"])
+        self.assertEqual(self.pipeline.calls[1], "Fleet\n\nplease fail")
+        self.assertEqual(summary["processed"], 3)
+        self.assertEqual(summary["failed"], 1)
+        self.assertIn("p95", summary["latency_ms"])
+
+    def test_resume_skips_completed_and_retries_failed(self):
+        with open(self.output_path, "w") as f:
+            f.write(json.dumps({"request_id": "a", "status": "ok", "result": "done"}) + "\n")
+            f.write('{"request_id": "c", "sta')
+
+        summary = batch_runner.run_batch(self.input_path, self.output_path)
+
+        self.assertEqual(self.pipeline.calls, ["Fleet\n\nplease fail", "quote for a warehouse"])
+        self.assertEqual(summary["skipped"], 1)
+        completed = batch_runner.load_checkpoint(self.output_path)
+        self.assertEqual(completed, {"a", "c"})
+
+    def test_malformed_lines_are_reported_and_skipped(self):
+        with open(self.input_path, "a") as f:
+            f.write('{"request_id": "d", "input_text": \n')
+            f.write(json.dumps({"request_id": "e", "input_text": "quote for a cafe"}) + "\n")
+
+        summary = batch_runner.run_batch(self.input_path, self.output_path)
+
+        records = {r["request_id"]: r for r in self.read_output()}
+        self.assertEqual(records["line-4"]["status"], "error")
+        self.assertIn("line 4", records["line-4"]["error"])
+        self.assertEqual(records["e"]["status"], "ok")
+        self.assertNotIn("latency_ms", records["line-4"])
+        self.assertEqual(summary["processed"], 5)
+        self.assertEqual(summary["failed"], 2)
+
+    def test_duplicate_ids_are_disambiguated(self):
+        with open(self.input_path, "a") as f:
+            f.write(json.dumps({"request_id": "a", "input_text": "quote for a second bakery"}) + "\n")
+
+        batch_runner.run_batch(self.input_path, self.output_path)
+        batch_runner.run_batch(self.input_path, self.output_path)
+
+        records = {r["request_id"]: r for r in self.read_output()}
+        self.assertEqual(records["a"]["result"], "analysis of quote for a bakery")
+        self.assertEqual(records["a#line-4"]["result"], "analysis of quote for a second bakery")
+        self.assertEqual(self.pipeline.calls.count("quote for a second bakery"), 1)
+
+    def test_retried_submissions_keep_only_the_last_record(self):
+        batch_runner.run_batch(self.input_path, self.output_path)
+        with open(self.input_path, "w") as f:
+            f.write(json.dumps({"request_id": "b", "input_text": "quote for a fleet"}) + "\n")
+
+        batch_runner.run_batch(self.input_path, self.output_path)
+
+        records = self.read_output()
+        self.assertEqual([r["request_id"] for r in records], ["a", "c", "b"])
+        self.assertEqual(records[-1]["status"], "ok")
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,73 @@
+import unittest
+import benchmark
+import synthetic_data
+
+class TestSyntheticData(unittest.TestCase):
+    def test_generators_are_seeded(self):
+        self.assertEqual(synthetic_data.generate_portfolio(50, seed=7), synthetic_data.generate_portfolio(50, seed=7))
+        self.assertNotEqual(synthetic_data.generate_applicants(50, seed=7), synthetic_data.generate_applicants(50, seed=8))
+
+    def test_shapes_match_agent_inputs(self):
+        [policy] = synthetic_data.generate_portfolio(1)
+        self.assertTrue({"location", "industry", "previous_claims", "coverage_amount"} <= policy.keys())
+        [claim] = synthetic_data.generate_claims(1)
+        self.assertTrue({"incident_date", "policy_end_date", "claimed_amount", "coverage_limit"} <= claim.keys())
+        [results] = synthetic_data.generate_esg_search_results(1, results_per_company=3)
+        self.assertEqual(len(results), 3)
+        self.assertIn("snippet", results[0])
+
+class TestRegressionGate(unittest.TestCase):
+    baseline = {"esg_compliance.scoring": {"throughput_per_second": 1000.0, "peak_memory_kib": 100.0}}
+
+    def test_within_threshold_passes(self):
+        results = {"esg_compliance.scoring": {"throughput_per_second": 800.0, "peak_memory_kib": 120.0}}
+        self.assertEqual(benchmark.compare(results, self.baseline, threshold=0.25), [])
+
+    def test_throughput_and_memory_regressions_fail(self):
+        results = {"esg_compliance.scoring": {"throughput_per_second": 700.0, "peak_memory_kib": 130.0}}
+        regressions = benchmark.compare(results, self.baseline, threshold=0.25)
+
+        self.assertEqual(len(regressions), 2)
+        self.assertIn("throughput", regressions[0])
+        self.assertIn("peak memory", regressions[1])
+
+    def test_benchmarks_without_baseline_are_ignored(self):
+        results = {"pipeline.end_to_end": {"throughput_per_second": 1.0, "peak_memory_kib": 1e9}}
+        self.assertEqual(benchmark.compare(results, self.baseline), [])
+
+    def test_unmeasured_baseline_entries_fail_the_gate(self):
+        report = {"results": {}, "unavailable": {"risk_exposure.portfolio": "cannot import agents.risk_exposure"}}
+
+        self.assertEqual(benchmark.unmeasured(report, self.baseline),
+                         ["esg_compliance.scoring", "risk_exposure.portfolio"])
+        self.assertEqual(benchmark.unmeasured(report, self.baseline, names=["hazard_grid.lookup"]),
+                         ["risk_exposure.portfolio"])
+
+    def test_only_a_failed_module_import_is_unavailable(self):
+        with self.assertRaises(benchmark.BenchmarkUnavailable):
+            benchmark.require("agents.no_such_agent")
+
+        def broken_setup():
+            def run():
+                import no_such_dependency
+            return run, 1
+        benchmark.BENCHMARKS["test.broken"] = broken_setup
+        try:
+            with self.assertRaises(ImportError):
+                benchmark.run_benchmarks(["test.broken"], repeats=1)
+        finally:
+            del benchmark.BENCHMARKS["test.broken"]
+
+    def test_agent_benchmarks_import_with_stand_ins(self):
+        for name in ("risk_exposure.portfolio", "underwriting.fraud_screening", "policy_management.claims"):
+            with self.subTest(name=name):
+                run, operations = benchmark.BENCHMARKS[name]()
+                self.assertGreater(operations, 0)
+
+    def test_pipeline_benchmark_measures(self):
+        result = benchmark.measure(benchmark.BENCHMARKS["pipeline.end_to_end"], repeats=1)
+        self.assertEqual(result["operations"], 1200)
+        self.assertGreater(result["throughput_per_second"], 0)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,49 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+HEAVY_MODULES = ['gradio', 'pandas', 'PyPDF2', 'crewai', 'dotenv']
+IMPORT_BUDGET_MS = float(os.getenv('IMPORT_BUDGET_MS', '250'))
+
+PROBE = '''
+import json, sys, time
+started = time.perf_counter()
+import {module}
+elapsed_ms = (time.perf_counter() - started) * 1000
+print(json.dumps({{"elapsed_ms": elapsed_ms, "modules": sorted(sys.modules)}}))
+'''
+
+def probe_import(module):
+    # Fresh interpreter per module so earlier imports in this process cannot hide a cost
+    output = subprocess.check_output(
+        [sys.executable, '-c', PROBE.format(module=module)],
+        cwd=os.path.dirname(os.path.abspath(__file__))
+    )
+    return json.loads(output)
+
+class TestColdStart(unittest.TestCase):
+    def test_headless_entry_points_skip_heavy_dependencies(self):
+        for module in ('main', 'batch_runner', 'pipeline'):
+            with self.subTest(module=module):
+                loaded = set(probe_import(module)['modules'])
+                self.assertEqual(loaded & set(HEAVY_MODULES), set())
+
+    def test_import_time_budget(self):
+        for module in ('main', 'batch_runner'):
+            with self.subTest(module=module):
+                self.assertLess(probe_import(module)['elapsed_ms'], IMPORT_BUDGET_MS)
+
+    def test_logger_import_has_no_side_effects(self):
+        code = ("import json, logging, os, sys; sys.path.insert(0, %r); import logger; "
+                "print(json.dumps([os.path.exists('logs'), len(logging.getLogger('main').handlers)]))"
+                % os.path.dirname(os.path.abspath(__file__)))
+        with tempfile.TemporaryDirectory() as tmp:
+            output = subprocess.check_output([sys.executable, '-c', code], cwd=tmp)
+
+        self.assertEqual(json.loads(output), [False, 0])
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,96 @@
+import math
+import os
+import tempfile
+import unittest
+import warnings
+import numpy as np
+import benchmark
+from hazard_grid import HazardGrid, build_from_csv, climate_vulnerability, write_hazard_grid
+
+class TestHazardGrid(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "hazard.grid")
+        bands = {
+            "heat": np.array([[35.0, 20.0], [25.0, 31.0]]),
+            "humidity": np.array([[80.0, 40.0], [75.0, 50.0]]),
+            "wind": np.array([[12.0, 5.0], [3.0, 11.0]]),
+            "flood": np.array([[0.9, 0.1], [0.2, np.nan]])
+        }
+        write_hazard_grid(self.path, 10.0, 20.0, 1.0, bands)
+        self.grid = HazardGrid(self.path)
+
+    def tearDown(self):
+        del self.grid
+        self.tmp.cleanup()
+
+    def test_grid_is_memory_mapped(self):
+        self.assertIsInstance(self.grid.data, np.memmap)
+        self.assertEqual((self.grid.rows, self.grid.cols), (2, 2))
+
+    def test_vectorized_lookup(self):
+        hazards = self.grid.lookup([10.5, 11.2, 50.0], [20.5, 20.9, 20.5])
+
+        np.testing.assert_allclose(hazards["heat"][:2], [35.0, 25.0])
+        self.assertTrue(math.isnan(hazards["heat"][2]))
+
+    def test_missing_coordinates_are_off_grid(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            hazards = self.grid.lookup([10.5, None, np.nan, np.inf], [20.5, 20.5, 21.5, 1e300])
+
+        self.assertEqual(hazards["heat"][0], 35.0)
+        self.assertTrue(np.isnan(hazards["heat"][1:]).all())
+
+    def test_vulnerability_scores(self):
+        scores = self.grid.vulnerability([10.5, 10.5, 11.5, 11.5, -5.0], [20.5, 21.5, 20.5, 21.5, 20.5])
+
+        np.testing.assert_allclose(scores[:3], [5.0, 0.0, 1.5])
+        # A cell with a missing band and a point off the grid both need a live fallback
+        self.assertTrue(np.isnan(scores[3]))
+        self.assertTrue(np.isnan(scores[4]))
+
+    def test_live_thresholds_unchanged(self):
+        self.assertEqual(float(climate_vulnerability(31, 71, 11)), 5.0)
+        self.assertEqual(float(climate_vulnerability(30, 70, 10)), 0.0)
+        self.assertEqual(float(climate_vulnerability(25, 90, 2)), 1.5)
+
+    def test_build_from_csv(self):
+        csv_path = os.path.join(self.tmp.name, "cells.csv")
+        with open(csv_path, "w") as f:
+            f.write("lat,lon,heat,humidity,wind,flood\n")
+            f.write("29.9,-90.1,33,85,8,0.8\n")
+            f.write("39.7,-105.0,22,35,12,0.1\n")
+        output = os.path.join(self.tmp.name, "built.grid")
+        build_from_csv(csv_path, output, resolution=0.25)
+
+        grid = HazardGrid(output)
+        np.testing.assert_allclose(grid.vulnerability([29.9, 39.7], [-90.1, -105.0]), [5.0, 1.5])
+        self.assertTrue(np.isnan(grid.vulnerability([35.0], [-98.0])[0]))
+
+class TestLiveAndGridScoring(unittest.TestCase):
+    def test_same_readings_score_the_same(self):
+        # One grid cell and a live OpenWeather reading (metric units) with the same values
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "hazard.grid")
+            bands = {"heat": [[25.0]], "humidity": [[75.0]], "wind": [[12.0]], "flood": [[0.0]]}
+            write_hazard_grid(path, 10.0, 20.0, 1.0, {k: np.array(v) for k, v in bands.items()})
+            grid = HazardGrid(path)
+
+            class Weather:
+                def get_weather(self, location):
+                    return {"main": {"temp": 25.0, "humidity": 75}, "wind": {"speed": 12.0}}
+
+            ESGCompliance = benchmark.require("esg_compliance").ESGCompliance
+            agent = benchmark.bare_agent(ESGCompliance, hazard_grid=grid, tools=[None, Weather(), None])
+            companies = [
+                {"location": "Gridville", "lat": 10.5, "lon": 20.5, "co2e": 1.0, "revenue": 1.0},
+                {"location": "Liveville", "co2e": 1.0, "revenue": 1.0}
+            ]
+            on_grid, live = agent.calculate_portfolio_carbon_risk(companies)
+
+        self.assertEqual(on_grid["climate_vulnerability"], 3.0)
+        self.assertEqual(live["climate_vulnerability"], on_grid["climate_vulnerability"])
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
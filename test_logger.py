@@ -0,0 +1,96 @@
+import json
+import logging
+import multiprocessing
+import os
+import queue
+import sys
+import tempfile
+import time
+import unittest
+from logger import (AsyncQueueHandler, configure_logging, configure_worker_logging, logging_stats, request_context,
+                    shutdown_logging, worker_log_queue)
+
+def log_from_worker(log_queue):
+    configure_worker_logging(log_queue)
+    logging.getLogger("batch_runner").info("Submission processed in worker")
+
+class TestQueueLogging(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        shutdown_logging()
+
+    def tearDown(self):
+        shutdown_logging()
+        self.tmp.cleanup()
+
+    def read_log(self, name):
+        with open(os.path.join(self.tmp.name, name)) as f:
+            return [json.loads(line) for line in f]
+
+    def test_records_are_structured_and_routed_by_component(self):
+        configure_logging(self.tmp.name)
+        with request_context("req-42"):
+            logging.getLogger("agents.underwriting").info("Evaluating risks for client")
+        logging.getLogger("router").warning("Routed request to crew", extra={"route": "crew"})
+        shutdown_logging()
+
+        [underwriting] = self.read_log("underwriting.log")
+        self.assertEqual(underwriting["message"], "Evaluating risks for client")
+        self.assertEqual(underwriting["request_id"], "req-42")
+        [fallback] = self.read_log("app.log")
+        self.assertEqual(fallback["route"], "crew")
+        self.assertIsNone(fallback["request_id"])
+
+    def test_debug_records_are_sampled(self):
+        configure_logging(self.tmp.name, level=logging.DEBUG, debug_sample_rate=0.0)
+        for _ in range(100):
+            logging.getLogger("main").debug("chatty detail")
+        logging.getLogger("main").info("kept")
+        shutdown_logging()
+
+        self.assertEqual(logging_stats()["sampled_out"], 100)
+        self.assertEqual([r["message"] for r in self.read_log("main.log")], ["kept"])
+
+    def test_worker_records_are_written_by_the_parent(self):
+        configure_logging(self.tmp.name)
+        worker = multiprocessing.get_context("fork").Process(target=log_from_worker, args=(worker_log_queue(),))
+        worker.start()
+        worker.join()
+        shutdown_logging()
+
+        [record] = self.read_log("batch_runner.log")
+        self.assertEqual(record["message"], "Submission processed in worker")
+        self.assertEqual(record["process"], worker.pid)
+
+    def test_full_queue_drops_instead_of_blocking(self):
+        handler = AsyncQueueHandler(queue.Queue(maxsize=1))
+        for _ in range(3):
+            handler.handle(logging.LogRecord("main", logging.INFO, __file__, 0, "burst", (), None))
+
+        self.assertEqual((handler.enqueued, handler.dropped), (1, 2))
+
+    def test_prepare_leaves_the_callers_record_intact(self):
+        try:
+            raise ValueError("bad rating table")
+        except ValueError:
+            record = logging.LogRecord("main", logging.ERROR, __file__, 0, "Rating %s failed", ("v2",), sys.exc_info())
+        prepared = AsyncQueueHandler(queue.Queue()).prepare(record)
+
+        self.assertIsNot(prepared, record)
+        self.assertEqual(prepared.msg, "Rating v2 failed")
+        self.assertIn("bad rating table", prepared.exc_text)
+        self.assertEqual(record.args, ("v2",))
+        self.assertIsNotNone(record.exc_info)
+
+    def test_per_record_overhead(self):
+        configure_logging(self.tmp.name)
+        logger = logging.getLogger("risk_exposure")
+        started = time.perf_counter()
+        for _ in range(2000):
+            logger.info("Calculating portfolio exposure")
+        per_record_us = (time.perf_counter() - started) / 2000 * 1e6
+
+        self.assertLess(per_record_us, 200)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,102 @@
+import os
+import tempfile
+import unittest
+from result_cache import ResultCache, config_fingerprint, file_digest, normalize_query
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+class FakeAgent:
+    def __init__(self, goal):
+        self.role = "Underwriting"
+        self.goal = goal
+        self.backstory = "Test agent"
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = ResultCache(ttl_seconds=60, max_entries=2, fingerprint="v1", clock=self.clock)
+        self.calls = 0
+
+    def compute(self):
+        self.calls += 1
+        return f"result {self.calls}"
+
+    def test_normalized_query_shares_entry(self):
+        digest = file_digest(None)
+        first = self.cache.get_or_compute("I need   insurance", digest, self.compute)
+        second = self.cache.get_or_compute("  i need insurance ", digest, self.compute)
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(normalize_query(" A\n b "), "a b")
+
+    def test_file_digest_is_part_of_key(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "claims.csv")
+            with open(path, "w") as f:
+                f.write("claims,2")
+            self.cache.get_or_compute("quote", file_digest(path), self.compute)
+            self.cache.get_or_compute("quote", file_digest(None), self.compute)
+
+        self.assertEqual(self.calls, 2)
+
+    def test_ttl_expiry(self):
+        self.cache.get_or_compute("quote", file_digest(None), self.compute)
+        self.clock.now += 61
+        self.cache.get_or_compute("quote", file_digest(None), self.compute)
+
+        self.assertEqual(self.calls, 2)
+
+    def test_lru_eviction(self):
+        for text in ("a", "b", "a", "c"):
+            self.cache.get_or_compute(text, file_digest(None), self.compute)
+
+        self.assertIsNotNone(self.cache.get(ResultCache.make_key("a")))
+        self.assertIsNone(self.cache.get(ResultCache.make_key("b")))
+        self.assertEqual(self.cache.stats()["entries"], 2)
+
+    def test_fingerprint_change_invalidates_entries(self):
+        self.cache.get_or_compute("quote", file_digest(None), self.compute)
+        self.cache.fingerprint = "v2"
+        self.cache.get_or_compute("quote", file_digest(None), self.compute)
+
+        self.assertEqual(self.calls, 2)
+
+    def test_config_fingerprint_tracks_agent_configuration(self):
+        before = config_fingerprint([FakeAgent("Evaluate risks")])
+        after = config_fingerprint([FakeAgent("Evaluate risks and detect fraud")])
+
+        self.assertNotEqual(before, after)
+        self.assertEqual(before, config_fingerprint([FakeAgent("Evaluate risks")]))
+
+    def test_config_fingerprint_tracks_data_files(self):
+        agents = [FakeAgent("Evaluate risks")]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "hazard.grid")
+            with open(path, "wb") as f:
+                f.write(b"grid-v1")
+            before = config_fingerprint(agents, data_files=[path])
+            with open(path, "wb") as f:
+                f.write(b"grid-v2 with more cells")
+
+            self.assertNotEqual(before, config_fingerprint(agents, data_files=[path]))
+            self.assertNotEqual(before, config_fingerprint(agents, data_files=[os.path.join(tmp, "other.grid")]))
+
+    def test_disk_tier_survives_restart(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ResultCache(ttl_seconds=60, disk_dir=tmp, fingerprint="v1", clock=self.clock)
+            cache.get_or_compute("quote", file_digest(None), self.compute)
+
+            restarted = ResultCache(ttl_seconds=60, disk_dir=tmp, fingerprint="v1", clock=self.clock)
+            self.assertEqual(restarted.get_or_compute("quote", file_digest(None), self.compute), "result 1")
+
+            stale = ResultCache(ttl_seconds=60, disk_dir=tmp, fingerprint="v2", clock=self.clock)
+            self.assertEqual(stale.get_or_compute("quote", file_digest(None), self.compute), "result 2")
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,108 @@
+import json
+import unittest
+from router import RequestRouter, ROUTE_CREW, ROUTE_FRAUD_CHECK, ROUTE_RISK_FACTORS, ROUTE_SUPPORT
+from support_responses import support_response
+
+class FakePolicyManagement:
+    # Same rules as PolicyManagement._generate_support_response
+    def _generate_support_response(self, customer_query):
+        return support_response(customer_query)
+
+class FakeRiskExposure:
+    def analyze_risk_factors(self, policy_data):
+        return [{"name": "Industry Risk", "level": "High", "score": 4.0, "description": policy_data["industry"]}]
+
+    def _format_risk_factors(self, risk_factors):
+        return "".join(f"- {factor['name']}: {factor['level']} (Score: {factor['score']})\n" for factor in risk_factors)
+
+class FakeUnderwriting:
+    FRAUD_PATTERN_THRESHOLD = 2
+
+    def _check_suspicious_patterns(self, client_data):
+        return client_data["flags"]
+
+class TestRequestRouter(unittest.TestCase):
+    def setUp(self):
+        self.router = RequestRouter(FakePolicyManagement(), FakeRiskExposure(), FakeUnderwriting())
+
+    def test_support_questions_are_answered_directly(self):
+        decision = self.router.route("Where can I find my policy number?")
+
+        self.assertEqual(decision.route, ROUTE_SUPPORT)
+        self.assertIn("account dashboard", decision.answer)
+
+    def test_claim_questions_get_the_claims_reply(self):
+        decision = self.router.route("How do I file a claim?")
+
+        self.assertEqual(decision.route, ROUTE_SUPPORT)
+        self.assertIn("claims portal", decision.answer)
+
+    def test_mixed_policy_and_claim_questions_escalate(self):
+        for query in ("How do I file a claim on my policy?",
+                      "Report a claim for water damage under policy number 123"):
+            with self.subTest(query=query):
+                self.assertEqual(self.router.route(query).route, ROUTE_CREW)
+
+    def test_coverage_questions_escalate(self):
+        decision = self.router.route("Where can I find a policy that covers flood damage for my construction firm in a coastal area?")
+
+        self.assertEqual(decision.route, ROUTE_CREW)
+
+    def test_open_ended_requests_escalate(self):
+        decision = self.router.route("What's the best policy for a high-risk construction project?")
+
+        self.assertEqual(decision.route, ROUTE_CREW)
+        self.assertTrue(decision.escalated)
+
+    def test_structured_risk_request(self):
+        payload = json.dumps({"location": "Denver", "industry": "construction", "previous_claims": 0,
+                              "coverage_amount": 2000000})
+        decision = self.router.route("Assess the risk factors for this policy", payload)
+
+        self.assertEqual(decision.route, ROUTE_RISK_FACTORS)
+        self.assertIn("Industry Risk: High (Score: 4.0)", decision.answer)
+
+    def test_structured_fraud_request(self):
+        payload = json.dumps({"age": 22, "credit_score": 450, "claims_history": 7, "flags": 3})
+        decision = self.router.route("Run a fraud check on this applicant", payload)
+
+        self.assertEqual(decision.route, ROUTE_FRAUD_CHECK)
+        self.assertIn("Suspected fraud: Yes", decision.answer)
+        self.assertNotIn("recommendation", decision.answer.lower())
+
+    def test_clean_fraud_check_reports_only_the_rule_outcome(self):
+        payload = json.dumps({"age": 40, "credit_score": 720, "claims_history": 0, "flags": 0})
+        decision = self.router.route("Run a fraud check on this applicant", payload)
+
+        self.assertIn("Suspected fraud: No", decision.answer)
+        self.assertNotIn("underwriting", decision.answer.lower())
+
+    def test_rule_failure_escalates_and_is_recorded(self):
+        payload = json.dumps({"age": 22, "credit_score": 450, "claims_history": 7})
+        decision = self.router.route("Run a fraud check on this applicant", payload)
+
+        self.assertTrue(decision.escalated)
+        self.assertEqual(self.router.stats()["fallbacks"], 1)
+
+    def test_partial_payloads_escalate(self):
+        cases = [
+            ("what is the risk here", {"location": "Denver"}),
+            ("fraud?", {"age": 40}),
+            ("asterisk in my quote", {"location": "Denver", "industry": "retail", "previous_claims": 0,
+                                      "coverage_amount": 1000})
+        ]
+        for query, payload in cases:
+            with self.subTest(query=query):
+                self.assertEqual(self.router.route(query, json.dumps(payload)).route, ROUTE_CREW)
+
+    def test_hit_rate(self):
+        self.router.route("How do I file a claim?")
+        self.router.route("I need insurance for my small business")
+
+        stats = self.router.stats()
+        self.assertEqual(stats["total"], 2)
+        self.assertEqual(stats["routes"], {ROUTE_SUPPORT: 1, ROUTE_CREW: 1})
+        self.assertAlmostEqual(stats["hit_rate"], 0.5)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
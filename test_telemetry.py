@@ -0,0 +1,72 @@
+import json
+import unittest
+from logger import request_context
+from pipeline import AnalysisPipeline
+from result_cache import ResultCache
+from telemetry import Telemetry, telemetry
+
+class FakeTaskOutput:
+    def __init__(self, description, agent):
+        self.description = description
+        self.agent = agent
+
+class FakeCrew:
+    def kickoff(self, input_text, file_content):
+        for description, agent in (("Evaluate risks and recommend policies", "Underwriting"),
+                                   ("Outline risk exposure", "Risk Exposure")):
+            telemetry.task_callback(FakeTaskOutput(description, agent))
+        return "analysis"
+
+class TestTelemetry(unittest.TestCase):
+    def setUp(self):
+        self.telemetry = Telemetry(buckets=(0.1, 1.0))
+
+    def test_spans_nest_within_a_request_trace(self):
+        with request_context("req-1"):
+            with self.telemetry.span("pipeline.run", kind="request") as outer:
+                with self.telemetry.span("weather_api", kind="tool"):
+                    pass
+
+        spans = {s["name"]: s for s in self.telemetry.trace("req-1")}
+        self.assertEqual(spans["weather_api"]["parent_id"], outer.span_id)
+        self.assertEqual(json.loads(self.telemetry.trace_json("req-1"))["request_id"], "req-1")
+
+    def test_traced_records_errors(self):
+        @self.telemetry.traced(kind="agent")
+        def calculate_carbon_risk():
+            raise KeyError("revenue")
+
+        with self.assertRaises(KeyError):
+            calculate_carbon_risk()
+
+        self.assertIn('insurcap_span_errors_total{kind="agent",name="TestTelemetry.test_traced_records_errors.<locals>.calculate_carbon_risk"} 1',
+                      self.telemetry.render_openmetrics())
+
+    def test_openmetrics_histogram_and_cache_ratio(self):
+        for duration_ms, cache in ((50, "hit"), (500, "miss"), (5000, "hit")):
+            self.telemetry.record({"name": "pipeline.run", "kind": "request", "duration_ms": duration_ms,
+                                   "status": "ok", "attributes": {"cache": cache}})
+
+        text = self.telemetry.render_openmetrics()
+        self.assertIn('insurcap_span_duration_seconds_bucket{kind="request",name="pipeline.run",le="0.1"} 1', text)
+        self.assertIn('insurcap_span_duration_seconds_bucket{kind="request",name="pipeline.run",le="1.0"} 2', text)
+        self.assertIn('insurcap_span_duration_seconds_bucket{kind="request",name="pipeline.run",le="+Inf"} 3', text)
+        self.assertIn('insurcap_span_duration_seconds_count{kind="request",name="pipeline.run"} 3', text)
+        self.assertIn('insurcap_cache_lookups_total{result="hit"} 2', text)
+        self.assertIn('insurcap_cache_hit_ratio 0.6666666666666666', text)
+        self.assertTrue(text.endswith("# EOF\n"))
+
+    def test_pipeline_records_tasks_and_cache_outcome(self):
+        telemetry.reset()
+        pipeline = AnalysisPipeline(FakeCrew(), cache=ResultCache())
+        pipeline.run("quote for a bakery", request_id="req-2")
+        pipeline.run("quote for a bakery", request_id="req-3")
+
+        names = [s["name"] for s in telemetry.trace("req-2")]
+        self.assertIn("task:Evaluate risks and recommend policies", names)
+        self.assertIn("crew.kickoff", names)
+        [request] = [s for s in telemetry.trace("req-3") if s["kind"] == "request"]
+        self.assertEqual(request["attributes"]["cache"], "hit")
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -1,13 +1,12 @@
 import os
 import requests
-from dotenv import load_dotenv
-
-load_dotenv()
+from telemetry import span, traced
 
 class ClimatiqAPITool:
     def __init__(self):
         self.api_key = os.getenv("CLIMATIQ_API_KEY")
 
+    @traced("climatiq_api", kind="tool")
     def estimate_emissions(self, industry, company_size):
         url = "https://beta3.api.climatiq.io/estimate"
         headers = {
@@ -24,7 +23,9 @@ class ClimatiqAPITool:
                 "area_unit": "ft2"
             }
         }
-        response = requests.post(url, json=data, headers=headers)
+        with span("climatiq.estimate", kind="external") as request_span:
+            response = requests.post(url, json=data, headers=headers)
+            request_span.set("status_code", response.status_code)
         if response.status_code == 200:
             return response.json()
         else:
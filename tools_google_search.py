@@ -1,17 +1,18 @@
 import os
 import requests
-from dotenv import load_dotenv
-
-load_dotenv()
+from telemetry import span, traced
 
 class GoogleSearchTool:
     def __init__(self):
         self.api_key = os.getenv("GOOGLE_API_KEY")
         self.search_engine_id = os.getenv("GOOGLE_SEARCH_ENGINE_ID")
 
+    @traced("google_search", kind="tool")
     def search(self, query):
         url = f"https://www.googleapis.com/customsearch/v1?key={self.api_key}&cx={self.search_engine_id}&q={query}"
-        response = requests.get(url)
+        with span("googleapis.customsearch", kind="external") as request_span:
+            response = requests.get(url)
+            request_span.set("status_code", response.status_code)
         if response.status_code == 200:
             return response.json()['items']
         else:
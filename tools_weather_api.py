@@ -1,16 +1,18 @@
 import os
 import requests
-from dotenv import load_dotenv
-
-load_dotenv()
+from telemetry import span, traced
 
 class WeatherAPITool:
     def __init__(self):
         self.api_key = os.getenv("WEATHER_API_KEY")
 
+    @traced("weather_api", kind="tool")
     def get_weather(self, location):
-        url = f"http://api.openweathermap.org/data/2.5/weather?q={location}&appid={self.api_key}"
-        response = requests.get(url)
+        # Metric units so temperatures are in C, like the hazard grid's heat band (the default is Kelvin)
+        url = f"http://api.openweathermap.org/data/2.5/weather?q={location}&units=metric&appid={self.api_key}"
+        with span("openweathermap.weather", kind="external") as request_span:
+            response = requests.get(url)
+            request_span.set("status_code", response.status_code)
         if response.status_code == 200:
             return response.json()
         else:
@@ -1,9 +1,13 @@
-    import logging
+import logging
 from crewai import Agent
+from telemetry import traced
 from tools.risk_assessment import RiskAssessmentTool
-from typing import Dict, Any
+from typing import ClassVar, Dict, Any
 
 class Underwriting(Agent):
+    # ClassVar keeps pydantic (crewai's Agent is a pydantic model) from treating it as a field
+    FRAUD_PATTERN_THRESHOLD: ClassVar[int] = 2
+
     def __init__(self):
         super().__init__(
             role="Underwriting",
@@ -13,6 +17,7 @@ class Underwriting(Agent):
         )
         self.logger = logging.getLogger(__name__)
 
+    @traced(kind="agent")
     def evaluate_risks(self, client_data: Dict[str, Any]) -> str:
         self.logger.info("Evaluating risks for client")
         try:
@@ -27,16 +32,18 @@ class Underwriting(Agent):
             self.logger.error(f"Error during risk evaluation: {str(e)}")
             raise
 
+    @traced(kind="agent")
     def detect_fraud(self, client_data: Dict[str, Any]) -> bool:
         self.logger.info("Detecting potential fraud")
         try:
             # Implement fraud detection logic here
             suspicious_patterns = self._check_suspicious_patterns(client_data)
-            return suspicious_patterns > 2
+            return suspicious_patterns > self.FRAUD_PATTERN_THRESHOLD
         except Exception as e:
             self.logger.error(f"Error during fraud detection: {str(e)}")
             raise
 
+    @traced(kind="agent")
     def recommend_policy(self, risk_evaluation: str, fraud_check: bool) -> str:
         self.logger.info("Recommending policy based on risk evaluation and fraud check")
         try: